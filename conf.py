@@ -24,11 +24,13 @@ extensions = [
     'sphinx.ext.autosummary',  # 모듈/클래스/함수를 표 형태로 깔끔하게 요약합니다.
     'sphinx.ext.napoleon',     # Google 및 NumPy 스타일 docstring을 지원합니다.
     'sphinx.ext.viewcode',     # 문서에서 소스 코드로 바로 이동하는 링크를 추가합니다.
-    'sphinx_rtd_theme',        # Read the Docs 테마를 사용합니다.
 ]
 
 # autosummary가 stub 파일을 자동으로 생성하도록 설정합니다.
-autosummary_generate = True
+# 증분 빌드에서는 SPHINX_AUTOSUMMARY=0 으로 stub 재생성을 건너뛸 수 있습니다.
+autosummary_generate = os.environ.get('SPHINX_AUTOSUMMARY', '1') == '1'
+# 이미 존재하는 stub 파일은 다시 쓰지 않습니다.
+autosummary_generate_overwrite = False
 
 templates_path = ['_templates']
 exclude_patterns = ['_build', 'Thumbs.db', '.DS_Store']
@@ -38,5 +40,6 @@ exclude_patterns = ['_build', 'Thumbs.db', '.DS_Store']
 # -- Options for HTML output -------------------------------------------------
 # https://www.sphinx-doc.org/en/master/usage/configuration.html#options-for-html-output
 
+# Read the Docs 테마를 사용합니다. 테마는 HTML 빌더가 실행될 때만 로드됩니다.
 html_theme = 'sphinx_rtd_theme'
 html_static_path = ['_static']
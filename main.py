@@ -14,19 +14,27 @@ This script is responsible for:
 - Handling top-level error recovery.
 """
 
+import os
 import sys
+import pickle
 import signal
 import time
-import multiprocessing as mp
+import functools
+import multiprocessing
+from collections import OrderedDict
+from queue import Empty, Queue
 from pathlib import Path
-from typing import Optional, NoReturn
+from typing import Dict, List, Optional, NoReturn, Set, Tuple
 import threading
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 
 from watchdog.observers import Observer
+from watchdog.observers.polling import PollingObserver
 from watchdog.events import FileSystemEventHandler
 
 from src.config.settings import Settings
+from src.config.constants import SCAN_MARKER_FILENAME
 from src.infrastructure.logging_handler import StructuredLogger
 from src.infrastructure.ui_process_manager import UIProcessManager
 from src.database.connection import DatabaseConnection
@@ -35,90 +43,197 @@ from src.repositories.case_repo import CaseRepository
 from src.infrastructure.gpu_monitor import GpuMonitor
 from src.handlers.remote_handler import RemoteHandler
 from src.utils.retry_policy import RetryPolicy
-from src.core.worker import worker_main
+from src.utils.path_manager import PathManager
+from src.core.worker import worker_main, init_worker
 from src.core.dispatcher import prepare_beam_jobs, run_case_level_csv_interpreting, run_case_level_upload, run_case_level_tps_generation
+from src.core.case_aggregator import update_case_status_from_beams
 from src.domain.enums import CaseStatus, BeamStatus
+from src.domain.models import CaseMessage
 
-def scan_existing_cases(case_queue: mp.Queue,
+
+def scan_existing_cases(case_queue: Queue,
                         settings: Settings,
-                        logger: StructuredLogger) -> None:
+                        logger: StructuredLogger,
+                        db_connection: DatabaseConnection,
+                        detection_handler: Optional["CaseDetectionHandler"] = None) -> None:
     """Scan for existing cases at startup.
     Compares file system cases with database records and queues new cases.
     Args:
-        case_queue (mp.Queue): The queue to add new cases to.
+        case_queue (Queue): The queue to add new cases to.
         settings (Settings): The application settings.
         logger (StructuredLogger): The logger for recording events.
+        db_connection (DatabaseConnection): An open connection; the caller owns it.
+        detection_handler (Optional[CaseDetectionHandler]): The already running
+            watcher's handler. Cases it has detected are skipped, and the cases
+            queued here are marked as seen so the watcher does not queue them again.
     """
+    started = time.perf_counter()
     try:
         # Get scan directory from settings
-        case_dirs = settings.get_case_directories()
+        case_dirs = settings.case_directories
         scan_directory = case_dirs.get("scan")
         if not scan_directory or not scan_directory.exists():
             logger.warning(
                 f"Scan directory does not exist or is not configured: {scan_directory}"
             )
             return
-        # Initialize database connection and case repository
-        db_path = settings.get_database_path()
-        with DatabaseConnection(db_path=db_path,
-                                config=settings.database,
-                                logger=logger) as db_connection:
-            case_repo = CaseRepository(db_connection, logger)
-            # Get all case IDs from database
-            existing_case_ids = set(case_repo.get_all_case_ids())
-            logger.info(
-                f"Found {len(existing_case_ids)} cases already in database")
+        # Case repository over the caller's shared connection
+        case_repo = CaseRepository(db_connection, logger)
+        # The marker is only trusted once; a run that crashes leaves none behind.
+        last_mtime_ns = _consume_scan_marker(settings)
+        if last_mtime_ns == os.stat(scan_directory).st_mtime_ns:
+            # No case directory was added or removed since a clean shutdown that
+            # found every case recorded, so only unfinished cases need queueing.
+            logger.info("Scan directory unchanged since last run; skipping directory scan")
+            restart_cases = {case.case_id: str(case.case_path)
+                             for case in case_repo.get_all_active_cases()
+                             if os.path.isdir(case.case_path)}
+            restart_ids = set(restart_cases)
+            case_paths = restart_cases
+            new_ids = sorted(restart_ids)
+        else:
             # Scan file system for case directories
-            filesystem_cases = []
-            for item in scan_directory.iterdir():
-                if item.is_dir():
-                    case_id = item.name
-                    filesystem_cases.append((case_id, item))
+            # scandir reuses the dirent type, so no extra stat() per entry.
+            # Paths are kept as strings since they are only queued.
+            with os.scandir(scan_directory) as entries:
+                filesystem_cases = {entry.name: entry.path for entry in entries
+                                    if entry.is_dir(follow_symlinks=False)}
             logger.info(
                 f"Found {len(filesystem_cases)} case directories in scan directory"
             )
             # Find cases that are in file system but not in database
-            new_cases = []
-            for case_id, case_path in filesystem_cases:
-                if case_id not in existing_case_ids:
-                    new_cases.append((case_id, case_path))
-            # Add new cases to processing queue
-            if new_cases:
-                logger.info(f"Found {len(new_cases)} new cases to process")
-                for case_id, case_path in new_cases:
-                    try:
-                        case_queue.put({
-                            'case_id': case_id,
-                            'case_path': str(case_path),
-                            'timestamp': time.time()
-                        })
-                        logger.info(
-                            f"Queued existing case for processing: {case_id}")
-                    except Exception as e:
-                        logger.error(
-                            f"Failed to queue existing case {case_id}",
-                            {"error": str(e)})
-            else:
-                logger.info("No new cases found during startup scan")
+            existing_case_ids = case_repo.get_known_case_ids(list(filesystem_cases))
+            logger.info(
+                f"Found {len(existing_case_ids)} scanned cases already in database")
+            # Cases a previous run left active (e.g. it crashed mid-case) have no live
+            # worker anymore; queue them again so they are resumed.
+            restart_ids = {case.case_id for case in case_repo.get_all_active_cases()}
+            restart_ids &= existing_case_ids
+            case_paths = filesystem_cases
+            # scandir order is arbitrary; queue in case-id order for a stable sequence.
+            new_ids = sorted((filesystem_cases.keys() - existing_case_ids) | restart_ids)
+        if detection_handler is not None:
+            new_ids = detection_handler.claim(new_ids)
+        new_cases = [(case_id, case_paths[case_id]) for case_id in new_ids]
+        if restart_ids:
+            logger.info(
+                f"Re-queueing {len(restart_ids)} cases left active by a previous run",
+                {"sample": sorted(restart_ids)[:10]})
+        # Add new cases to processing queue
+        if new_cases:
+            # Queue the whole startup batch as one item; the worker loop
+            # unpacks it. All entries share the same scan timestamp.
+            now = time.monotonic_ns()
+            case_queue.put([CaseMessage(case_id, case_path, now)
+                            for case_id, case_path in new_cases])
+            # One summary line rather than one per case.
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            logger.info(f"Queued {len(new_cases)} existing cases in {elapsed_ms:.1f} ms", {
+                "count": len(new_cases),
+                "sample": [case_id for case_id, _ in new_cases[:10]]
+            })
+        else:
+            logger.info("No new cases found during startup scan")
     except Exception as e:
         logger.error("Failed to scan existing cases during startup",
                      {"error": str(e)})
 
 
+def _scan_marker_path(settings: Settings) -> Path:
+    """Returns the file holding the scan directory mtime recorded at shutdown.
+    Args:
+        settings (Settings): The application settings.
+    Returns:
+        Path: The marker file, kept next to the database.
+    """
+    return settings.database_path.parent / SCAN_MARKER_FILENAME
+
+
+def _consume_scan_marker(settings: Settings) -> Optional[int]:
+    """Reads and removes the scan directory marker.
+    Args:
+        settings (Settings): The application settings.
+    Returns:
+        Optional[int]: The recorded mtime in nanoseconds, or None if there is no
+        usable marker.
+    """
+    marker_path = _scan_marker_path(settings)
+    try:
+        mtime_ns = int(marker_path.read_text())
+    except (OSError, ValueError):
+        return None
+    finally:
+        try:
+            marker_path.unlink()
+        except OSError:
+            pass
+    return mtime_ns
+
+
+def record_scan_marker(settings: Settings,
+                       logger: StructuredLogger,
+                       db_connection: DatabaseConnection) -> None:
+    """Records the scan directory mtime if every case in it is in the database.
+    The next startup scan compares against this value and skips enumerating the
+    scan directory when it is unchanged. The marker is only written when no case
+    directory is missing from the database, so a case that was detected but not
+    yet recorded is never skipped.
+    Args:
+        settings (Settings): The application settings.
+        logger (StructuredLogger): The logger for recording events.
+        db_connection (DatabaseConnection): An open connection; the caller owns it.
+    """
+    try:
+        scan_directory = settings.case_directories.get("scan")
+        if not scan_directory or not scan_directory.exists():
+            return
+        # Stat before listing so a case added meanwhile invalidates the marker.
+        mtime_ns = os.stat(scan_directory).st_mtime_ns
+        with os.scandir(scan_directory) as entries:
+            case_ids = [entry.name for entry in entries
+                        if entry.is_dir(follow_symlinks=False)]
+        known_ids = CaseRepository(db_connection, logger).get_known_case_ids(case_ids)
+        if len(known_ids) != len(case_ids):
+            logger.info("Unrecorded cases remain; the next startup will rescan",
+                        {"unrecorded": len(case_ids) - len(known_ids)})
+            return
+        _scan_marker_path(settings).write_text(str(mtime_ns))
+    except Exception as e:
+        logger.warning("Failed to record scan directory state", {"error": str(e)})
+
+
 class CaseDetectionHandler(FileSystemEventHandler):
     """Handles file system events to detect new case directories.
     This handler watches for directory creation events and queues new cases for processing.
+    Each detected case is held back until it has had no new event for the debounce
+    period, so a burst of events for the same directory results in one queue entry.
+    A case that was already queued and is seen again within RECENT_TTL_SECONDS of
+    its last event is ignored.
     """
 
-    def __init__(self, case_queue: mp.Queue, logger: StructuredLogger):
+    # Duplicate events for a directory (common on SMB/CIFS) arrive within this window.
+    RECENT_TTL_SECONDS = 2.0
+    RECENT_CAPACITY = 1024
+
+    def __init__(self, case_queue: Queue, logger: StructuredLogger, debounce_ms: int = 0):
         """Initializes the CaseDetectionHandler.
         Args:
-            case_queue (mp.Queue): The queue for new cases.
+            case_queue (Queue): The queue for new cases.
             logger (StructuredLogger): The logger for recording events.
+            debounce_ms (int): Quiet period in milliseconds before pending cases
+                are queued. 0 queues every case as soon as it is detected.
         """
         super().__init__()
         self.case_queue = case_queue
         self.logger = logger
+        self.debounce_seconds = max(debounce_ms, 0) / 1000.0
+        # case_id -> (case_path, monotonic time of the latest event)
+        self._pending: Dict[str, Tuple[str, float]] = {}
+        self._pending_lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+        # case_id -> monotonic time it was last seen, oldest first. Shared with
+        # the startup scan, so it is guarded by the same lock as _pending.
+        self._recent: "OrderedDict[str, float]" = OrderedDict()
 
     def on_created(self, event) -> None:
         """Handles the 'created' event from the file system watcher.
@@ -128,20 +243,110 @@ class CaseDetectionHandler(FileSystemEventHandler):
         """
         if not event.is_directory:
             return
-        case_path = Path(event.src_path)
-        case_id = case_path.name
-        self.logger.info(f"New case detected: {case_id} at {case_path}")
+        # Plain string ops: the event path is already a str and is queued as-is.
+        case_path = event.src_path
+        case_id = os.path.basename(case_path.rstrip('/\\'))
+        now = time.monotonic()
+        with self._pending_lock:
+            pending = self._pending.get(case_id)
+            if pending is not None:
+                # Still settling: a repeat event restarts the case's quiet period.
+                self._pending[case_id] = (pending[0], now)
+                self._remember(case_id, now)
+                return
+            # Any other case seen within the TTL was already queued or claimed.
+            last_seen = self._recent.get(case_id)
+            if last_seen is not None and last_seen > now - self.RECENT_TTL_SECONDS:
+                return
+            self._remember(case_id, now)
+            debounced = self.debounce_seconds > 0
+            if debounced:
+                self._pending[case_id] = (case_path, now)
+                # A running timer already covers an older, earlier deadline.
+                if self._timer is None:
+                    self._start_timer(self.debounce_seconds)
+        self.logger.debug(f"New case detected: {case_id} at {case_path}")
+        if not debounced:
+            self._enqueue([(case_id, case_path)])
+
+    def claim(self, case_ids: List[str]) -> List[str]:
+        """Marks cases found by another producer as seen by this handler.
+        Used by the startup scan, which runs while the watcher is already active:
+        cases the watcher has detected since it started are left to the watcher.
+        Args:
+            case_ids (List[str]): Candidate case identifiers, in queueing order.
+        Returns:
+            List[str]: The identifiers this handler had not seen, in the same order.
+        """
+        now = time.monotonic()
+        claimed = []
+        with self._pending_lock:
+            for case_id in case_ids:
+                if case_id not in self._recent:
+                    claimed.append(case_id)
+                self._remember(case_id, now)
+        return claimed
+
+    def _remember(self, case_id: str, now: float) -> None:
+        """Records a case as seen. The caller must hold ``_pending_lock``.
+        Args:
+            case_id (str): The case identifier.
+            now (float): The current monotonic time.
+        """
+        self._recent[case_id] = now
+        self._recent.move_to_end(case_id)
+        if len(self._recent) > self.RECENT_CAPACITY:
+            self._recent.popitem(last=False)
+
+    def _start_timer(self, delay: float) -> None:
+        """Schedules the next flush. The caller must hold ``_pending_lock``.
+        Args:
+            delay (float): Seconds until the oldest pending case is due.
+        """
+        self._timer = threading.Timer(delay, self._flush_pending)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _flush_pending(self) -> None:
+        """Queues every pending case that has been quiet for the debounce period.
+        Cases still inside their quiet period stay pending, and the timer is
+        rescheduled for the earliest of their deadlines, so a steady stream of
+        new cases never holds back the ones that are already due.
+        """
+        now = time.monotonic()
+        cutoff = now - self.debounce_seconds
+        with self._pending_lock:
+            ready = [(case_id, case_path)
+                     for case_id, (case_path, seen) in self._pending.items()
+                     if seen <= cutoff]
+            for case_id, _ in ready:
+                del self._pending[case_id]
+            if self._pending:
+                oldest = min(seen for _, seen in self._pending.values())
+                self._start_timer(max(oldest - cutoff, 0.0))
+            else:
+                self._timer = None
+        if ready:
+            self._enqueue(ready)
+
+    def _enqueue(self, cases: List[Tuple[str, str]]) -> None:
+        """Puts detected cases on the processing queue in a single operation.
+        Args:
+            cases (List[Tuple[str, str]]): (case_id, case_path) pairs to queue.
+        """
+        now = time.monotonic_ns()
         try:
-            # Add the case to the processing queue
-            self.case_queue.put({
-                'case_id': case_id,
-                'case_path': str(case_path),
-                'timestamp': time.time()
-            })
-            self.logger.info(f"Case {case_id} queued for processing")
+            # Add the cases to the processing queue
+            self.case_queue.put([CaseMessage(case_id, case_path, now)
+                                 for case_id, case_path in cases])
+            for case_id, _ in cases:
+                self.logger.debug(f"Case {case_id} queued for processing")
+            self.logger.info(f"Queued {len(cases)} detected cases for processing",
+                             {"sample": [case_id for case_id, _ in cases[:10]]})
         except Exception as e:
-            self.logger.error(f"Failed to queue case {case_id}",
-                              {"error": str(e)})
+            self.logger.error("Failed to queue detected cases",
+                              {"case_ids": [case_id for case_id, _ in cases],
+                               "error": str(e)})
 
 
 class MQIApplication:
@@ -150,6 +355,16 @@ class MQIApplication:
     coordination of components, and graceful shutdown.
     """
 
+    # Threads running case-level preprocessing (beam discovery, CSV interpreting).
+    CASE_PREP_THREADS = 8
+    # Beam submissions allowed in flight per worker process before dispatch blocks.
+    BEAM_SLOTS_PER_WORKER = 4
+    # Cases handed to the prep pool but not finished, per prep thread, before the
+    # worker loop stops draining the case queue.
+    PREP_BACKLOG_PER_THREAD = 2
+    # Longest the worker loop waits on an empty queue before re-checking for shutdown.
+    QUEUE_POLL_SECONDS = 1.0
+
     def __init__(self, config_path: Optional[Path] = None):
         """Initializes the MQIApplication instance.
         Args:
@@ -162,13 +377,33 @@ class MQIApplication:
             self.config_path = None
         self.settings = Settings(self.config_path)
         self.logger: Optional[StructuredLogger] = None
-        self.case_queue = mp.Queue()
+        # Producers (watcher, startup scan) and the consumer all live in this process,
+        # so a plain thread-safe queue avoids mp.Queue's pickling and feeder thread.
+        # It is bounded so a flood of new-case events blocks the producer instead of
+        # growing without limit. The startup scan runs before the consumer starts, so
+        # it queues its cases as a single item rather than risk waiting for space.
+        self.case_queue: Queue = Queue(maxsize=self.settings.processing.case_queue_maxsize)
+        # Caps cases submitted to the prep pool but not yet finished. Once it is
+        # exhausted the worker loop stops draining case_queue, which then fills up
+        # and pushes back on the producers.
+        self._prep_slots = threading.BoundedSemaphore(
+            self.CASE_PREP_THREADS * self.PREP_BACKLOG_PER_THREAD)
         self.observer: Optional[Observer] = None
+        self.case_handler: Optional[CaseDetectionHandler] = None
         self.executor: Optional[ProcessPoolExecutor] = None
+        # In-flight beam futures; each callback already carries its beam_id.
+        self.active_futures: Set[Future] = set()
+        self._futures_lock = threading.Lock()
+        self._dispatch_lock = threading.Lock()
+        # Caps active_futures; sized once the worker count is known.
+        self._beam_slots: Optional[threading.BoundedSemaphore] = None
+        self._beam_pool_size = 0
         self.ui_process_manager: Optional[UIProcessManager] = None
         self.gpu_monitor: Optional[GpuMonitor] = None
-        self.monitor_db_connection: Optional[DatabaseConnection] = None
+        self.db_connection: Optional[DatabaseConnection] = None
         self.shutdown_event = threading.Event()
+        # Set once shutdown() has started; later calls return immediately.
+        self._shutdown_done = threading.Event()
         self.service_monitor_thread: Optional[threading.Thread] = None
 
     def initialize_logging(self) -> None:
@@ -185,14 +420,16 @@ class MQIApplication:
 
     def initialize_database(self) -> None:
         """Initializes the database connection and schema.
+        The connection is kept open and shared by the startup scan and the GPU
+        monitor; it is closed in shutdown().
         Exits the application if the database cannot be initialized.
         """
         try:
-            db_path = self.settings.get_database_path()
-            with DatabaseConnection(db_path=db_path,
-                                    config=self.settings.database,
-                                    logger=self.logger) as db_connection:
-                db_connection.init_db()
+            db_path = self.settings.database_path
+            self.db_connection = DatabaseConnection(db_path=db_path,
+                                                    config=self.settings.database,
+                                                    logger=self.logger)
+            self.db_connection.init_db()
             self.logger.info("Database initialized successfully", {"path": str(db_path)})
         except Exception as e:
             self.logger.error("Failed to initialize database",
@@ -202,19 +439,38 @@ class MQIApplication:
     def start_file_watcher(self) -> None:
         """Starts the file system watcher to detect new cases."""
         try:
-            case_dirs = self.settings.get_case_directories()
+            case_dirs = self.settings.case_directories
             scan_directory = case_dirs.get("scan")
             if not scan_directory or not scan_directory.exists():
                 self.logger.error(
                     f"Scan directory does not exist: {scan_directory}")
                 return
-            event_handler = CaseDetectionHandler(self.case_queue, self.logger)
-            self.observer = Observer()
-            self.observer.schedule(event_handler,
+            watcher_config = self.settings.file_watcher
+            self.case_handler = CaseDetectionHandler(self.case_queue, self.logger,
+                                                     debounce_ms=watcher_config.debounce_ms)
+            backend = watcher_config.backend
+            if backend not in ("auto", "native", "polling"):
+                self.logger.warning(
+                    f"Unknown file watcher backend '{backend}', using 'auto'")
+                backend = "auto"
+            if backend == "auto":
+                # Network shares do not deliver native change events reliably.
+                is_network = PathManager().is_network_filesystem(scan_directory)
+                backend = "polling" if is_network else "native"
+            if backend == "polling":
+                # Poll at the configured interval instead of watchdog's 1s default.
+                self.observer = PollingObserver(
+                    timeout=watcher_config.poll_interval_seconds)
+            else:
+                self.observer = Observer()
+            self.observer.schedule(self.case_handler,
                                    str(scan_directory),
                                    recursive=False)
             self.observer.start()
-            self.logger.info(f"Watching for new cases in: {scan_directory}")
+            self.logger.info(
+                f"Watching for new cases in: {scan_directory}",
+                {"backend": backend,
+                 "poll_interval_seconds": watcher_config.poll_interval_seconds})
         except Exception as e:
             self.logger.error("Failed to start file watcher", {"error": str(e)})
 
@@ -226,7 +482,7 @@ class MQIApplication:
                 return
             # Get database path and resolve to an absolute path to ensure the
             # subprocess can find it regardless of its working directory.
-            db_path = self.settings.get_database_path().resolve()
+            db_path = self.settings.database_path.resolve()
             # Create UI process manager
             self.ui_process_manager = UIProcessManager(
                 database_path=str(db_path),
@@ -246,13 +502,8 @@ class MQIApplication:
         """Starts the GPU monitoring service in a background thread."""
         try:
             self.logger.info("Initializing GPU monitoring service.")
-            # Create a dedicated database connection for the monitor
-            db_path = self.settings.get_database_path()
-            self.monitor_db_connection = DatabaseConnection(
-                db_path=db_path,
-                config=self.settings.database,
-                logger=self.logger)
-            gpu_repo = GpuRepository(self.monitor_db_connection, self.logger)
+            # Reuse the application's connection; its transactions are thread-safe.
+            gpu_repo = GpuRepository(self.db_connection, self.logger)
             # Create dependencies for RemoteHandler
             retry_policy = RetryPolicy(
                 max_attempts=self.settings.retry_policy.max_retries,
@@ -278,110 +529,333 @@ class MQIApplication:
     
     def run_worker_loop(self) -> None:
         """The main loop for processing cases from the queue.
-        Manages a process pool to handle cases concurrently.
+        Manages a process pool to handle cases concurrently. The loop waits on the
+        case queue and hands each case to a preprocessing thread, so it stays free
+        to pick up new arrivals; finished beam workers are reported through future
+        callbacks.
         """
         max_workers = self.settings.processing.max_workers
-        with ProcessPoolExecutor(max_workers=max_workers) as executor:
-            self.executor = executor
-            self.logger.info(f"Started worker pool with {max_workers} processes")
-            active_futures = {}
-            while not self.shutdown_event.is_set():
-                try:
-                    # Check for new cases
+        self._warn_if_host_busy(max_workers)
+        self._beam_slots = threading.BoundedSemaphore(
+            max_workers * self.BEAM_SLOTS_PER_WORKER)
+        self._beam_pool_size = max_workers
+        self.executor = self._create_beam_pool()
+        self.logger.info(f"Started worker pool with {max_workers} processes")
+        try:
+            # The prep pool is shut down (and drained) first, while the process
+            # pool can still accept its beam submissions.
+            with ThreadPoolExecutor(max_workers=self.CASE_PREP_THREADS,
+                                    thread_name_prefix="case-prep") as prep_executor:
+                while not self.shutdown_event.is_set():
                     try:
-                        # Get a new case from the queue
-                        case_data = self.case_queue.get(timeout=1.0)
-                        case_id = case_data["case_id"]
-                        case_path = Path(case_data["case_path"])
-                        self.logger.info(f"Processing new case: {case_id}")
-
-                        # The main process now orchestrates the initial case-level steps
-                        # and updates the database so the UI can reflect the status.
-                        with DatabaseConnection(db_path=self.settings.get_database_path(),
-                                                config=self.settings.database,
-                                                logger=self.logger) as db_conn:
-                            case_repo = CaseRepository(db_conn, self.logger)
-                            # Step 1: Discover beams and validate data transfer completion
-                            self.logger.info(f"Discovering beams and validating data transfer for case: {case_id}")
-                            beam_jobs = prepare_beam_jobs(case_id, case_path, self.settings)
-                            if not beam_jobs:
-                                self.logger.error(f"No beams found or data transfer validation failed for case {case_id}. Skipping.")
-                                case_repo.add_case(case_id, case_path)
-                                case_repo.update_case_status(case_id, CaseStatus.FAILED,
-                                                            error_message="No beams found or data transfer incomplete.")
-                                continue
-
-                            case_repo.create_case_with_beams(case_id, str(case_path), beam_jobs)
-                            self.logger.info(f"Created {len(beam_jobs)} beam records in DB for case {case_id}")
-
-                            # Step 2: Run case-level CSV interpreting
-                            case_repo.update_beams_status_by_case_id(case_id, BeamStatus.CSV_INTERPRETING.value)
-                            self.logger.info(f"Starting case-level CSV interpreting for {case_id}")
-                            interpreting_success = run_case_level_csv_interpreting(case_id, case_path, self.settings)
-                            if not interpreting_success:
-                                self.logger.error(f"Case-level CSV interpreting failed for {case_id}. Skipping.")
-                                case_repo.update_case_status(case_id, CaseStatus.FAILED, error_message="CSV interpreting failed.")
-                                case_repo.update_beams_status_by_case_id(case_id, BeamStatus.FAILED.value)
-                                continue
-
-                            # Step 3: Generate TPS file with dynamic GPU assignments
-                            case_repo.update_beams_status_by_case_id(case_id, BeamStatus.TPS_GENERATION.value)
-                            self.logger.info(f"Starting case-level TPS generation for {case_id}")
-                            gpu_assignments = run_case_level_tps_generation(case_id, case_path, len(beam_jobs), self.settings)
-                            if not gpu_assignments:
-                                self.logger.error(f"Case-level TPS generation failed for {case_id}. Skipping.")
-                                case_repo.update_case_status(case_id, CaseStatus.FAILED, error_message="TPS generation failed.")
-                                case_repo.update_beams_status_by_case_id(case_id, BeamStatus.FAILED.value)
-                                continue
-
-                            # Step 4: Run case-level file upload to HPC
-                            case_repo.update_beams_status_by_case_id(case_id, BeamStatus.UPLOADING.value)
-                            self.logger.info(f"Starting case-level file upload for {case_id}")
-                            upload_success = run_case_level_upload(case_id, case_path, self.settings)
-                            if not upload_success:
-                                self.logger.error(f"Case-level upload failed for {case_id}. Skipping.")
-                                case_repo.update_case_status(case_id, CaseStatus.FAILED, error_message="File upload failed.")
-                                case_repo.update_beams_status_by_case_id(case_id, BeamStatus.FAILED.value)
-                                continue
-
-                            # Step 5: Dispatch individual workers for simulation
-                            case_repo.update_beams_status_by_case_id(case_id, BeamStatus.PENDING.value)  # Workers will pick this up
-                            self.logger.info(f"Dispatching workers for case: {case_id}")
-                            for job in beam_jobs:
-                                beam_id = job["beam_id"]
-                                beam_path = job["beam_path"]
-                                self.logger.info(f"Submitting beam worker for: {beam_id}")
-                                future = executor.submit(worker_main,
-                                                         beam_id=beam_id,
-                                                         beam_path=beam_path,
-                                                         settings=self.settings)
-                                active_futures[future] = beam_id
-
-                    except mp.queues.Empty:
-                        pass  # Queue timeout, continue
-                    except Exception as e:
-                        self.logger.error(f"Error processing case from queue", {"error": str(e)})
-
-                    # Check for completed workers
-                    completed_futures = []
-                    for future in as_completed(active_futures.keys(), timeout=0.1):
-                        completed_futures.append(future)
-
-                    for future in completed_futures:
-                        beam_id = active_futures.pop(future)
-                        try:
-                            future.result()  # Raise exception if worker failed
-                            self.logger.info(f"Beam worker {beam_id} completed successfully")
-                        except Exception as e:
-                            self.logger.error(f"Beam worker {beam_id} failed", {"error": str(e)})
-
-                except KeyboardInterrupt:
-                    self.logger.info("Received shutdown signal")
-                    break
-                except Exception as e:
-                    self.logger.error("Error in worker loop", {"error": str(e)})
-                # Prevent busy-waiting
-                time.sleep(1)
+                        batch = self._drain_case_queue(max_items=max_workers * 2)
+                    except KeyboardInterrupt:
+                        self.logger.info("Received shutdown signal")
+                        break
+                    if self.shutdown_event.is_set():
+                        # Cases not handed over have no database record yet,
+                        # so the next startup scan queues them again.
+                        break
+                    for case_data in batch:
+                        if not self._acquire_slot(self._prep_slots):
+                            break
+                        prep_future = prep_executor.submit(self._process_case, case_data)
+                        prep_future.add_done_callback(
+                            lambda _future: self._prep_slots.release())
+        finally:
+            # The pool may have been replaced after breaking; shut down the current one.
+            self.executor.shutdown(wait=True)
+
+    def _create_beam_pool(self) -> ProcessPoolExecutor:
+        """Creates the process pool that runs beam workers.
+        Returns:
+            ProcessPoolExecutor: The new pool.
+        """
+        if sys.platform.startswith("linux"):
+            # Fork workers from a small server process that has already imported
+            # the worker module, rather than forking this multi-threaded process
+            # or re-importing everything per worker as spawn does.
+            mp_context = multiprocessing.get_context("forkserver")
+            mp_context.set_forkserver_preload(["src.core.worker"])
+        else:
+            mp_context = multiprocessing.get_context("spawn")
+        # Ship the settings to each worker once, not with every submitted beam.
+        initargs = (pickle.dumps(self.settings, protocol=pickle.HIGHEST_PROTOCOL),)
+        if self.settings.processing.pin_workers:
+            if hasattr(os, "sched_setaffinity"):
+                # Workers take CPUs round-robin in the order they start.
+                initargs += (mp_context.Value("i", 0),)
+            else:
+                self.logger.warning(
+                    "pin_workers is not supported on this platform; ignoring")
+        return ProcessPoolExecutor(max_workers=self._beam_pool_size,
+                                   mp_context=mp_context,
+                                   initializer=init_worker,
+                                   initargs=initargs)
+
+    def _warn_if_host_busy(self, max_workers: int) -> None:
+        """Logs a warning when the host has fewer idle CPUs than beam workers.
+        Beam workers launch heavy local subprocesses, so more of them than idle
+        cores oversubscribes the host. The pool keeps the configured size, because
+        one load-average reading taken at startup is no basis for sizing it for
+        the life of the process. Platforms without a load average (Windows) skip
+        the check.
+        Args:
+            max_workers (int): The number of worker processes being started.
+        """
+        if not hasattr(os, "getloadavg"):
+            return
+        try:
+            load = os.getloadavg()[0]
+        except OSError:
+            return
+        idle_cpus = (os.cpu_count() or 1) - load
+        if idle_cpus < max_workers:
+            self.logger.warning("Host has fewer idle CPUs than configured workers",
+                                {"max_workers": max_workers,
+                                 "idle_cpus": round(idle_cpus, 1),
+                                 "load_average": load})
+
+    def _drain_case_queue(self, max_items: int) -> list:
+        """Waits for the next queued item, then takes up to ``max_items`` items in total.
+        The wait is bounded by QUEUE_POLL_SECONDS so the caller can notice a
+        shutdown request even when no case arrives; an untimed wait cannot be
+        interrupted by Ctrl+C on Windows.
+        Producers may queue either a single case entry or a list of entries;
+        lists are flattened into the batch. Items beyond the limit stay queued
+        for the next call, so the shutdown check runs between bursts.
+        Args:
+            max_items (int): The maximum number of queue items to take.
+        Returns:
+            list: The queued entries in arrival order; empty if the wait timed out.
+        """
+        try:
+            items = [self.case_queue.get(timeout=self.QUEUE_POLL_SECONDS)]
+        except Empty:
+            return []
+        while len(items) < max_items:
+            try:
+                items.append(self.case_queue.get_nowait())
+            except Empty:
+                break
+        batch = []
+        for item in items:
+            if isinstance(item, list):
+                batch.extend(item)
+            else:
+                batch.append(item)
+        return batch
+
+    def _process_case(self, case_data: CaseMessage) -> None:
+        """Preprocesses a queued case and dispatches its beams; runs on a prep thread.
+        Beam discovery and CSV interpreting are I/O-bound and independent per case, so
+        they run concurrently across prep threads. GPU allocation, upload and beam
+        submission are serialized by the dispatch lock so cases never race for the
+        same GPUs.
+        Args:
+            case_data (CaseMessage): The queued case entry.
+        """
+        case_id = case_data.case_id
+        try:
+            if self.shutdown_event.is_set():
+                return
+            # Producers queue plain strings; wrap once for all case-level steps.
+            case_path = Path(case_data.case_path)
+            beam_jobs = self._preprocess_case(case_id, case_path)
+            if not beam_jobs or self.shutdown_event.is_set():
+                return
+            with self._dispatch_lock:
+                self._dispatch_case(case_id, case_path, beam_jobs)
+        except Exception as e:
+            self.logger.error("Error processing case from queue",
+                              {"case_id": case_id, "error": str(e)})
+
+    def _preprocess_case(self, case_id: str, case_path: Path) -> Optional[list]:
+        """Discovers a case's beams, records them and runs case-level CSV interpreting.
+        Args:
+            case_id (str): The case identifier.
+            case_path (Path): The case directory.
+        Returns:
+            Optional[list]: The beam jobs if preprocessing succeeded, None otherwise.
+        """
+        self.logger.info(f"Processing new case: {case_id}")
+
+        # The main process now orchestrates the initial case-level steps
+        # and updates the database so the UI can reflect the status.
+        with DatabaseConnection(db_path=self.settings.database_path,
+                                config=self.settings.database,
+                                logger=self.logger) as db_conn:
+            case_repo = CaseRepository(db_conn, self.logger)
+            # Step 1: Discover beams and validate data transfer completion
+            self.logger.info(
+                f"Discovering beams and validating data transfer for case: {case_id}")
+            beam_jobs = prepare_beam_jobs(case_id, case_path, self.settings)
+            if not beam_jobs:
+                self.logger.error("No beams found or data transfer validation failed "
+                                  f"for case {case_id}. Skipping.")
+                # A resumed case already has its record.
+                if case_repo.get_case(case_id) is None:
+                    case_repo.add_case(case_id, case_path)
+                case_repo.update_case_status(
+                    case_id, CaseStatus.FAILED,
+                    error_message="No beams found or data transfer incomplete.")
+                return None
+
+            case_repo.create_case_with_beams(case_id, str(case_path), beam_jobs)
+            self.logger.info(
+                f"Created {len(beam_jobs)} beam records in DB for case {case_id}")
+
+            # A resumed case keeps the beams a previous run finished; only the rest
+            # are simulated again.
+            finished_ids = {beam.beam_id for beam in case_repo.get_beams_for_case(case_id)
+                            if beam.status in CaseRepository.TERMINAL_BEAM_STATUSES}
+            if finished_ids:
+                beam_jobs = [job for job in beam_jobs if job["beam_id"] not in finished_ids]
+                self.logger.info(f"Resuming case {case_id}",
+                                 {"finished_beams": len(finished_ids),
+                                  "remaining_beams": len(beam_jobs)})
+                if not beam_jobs:
+                    update_case_status_from_beams(case_id, case_repo)
+                    return None
+
+            # Step 2: Run case-level CSV interpreting
+            case_repo.update_unfinished_beams_status(case_id,
+                                                     BeamStatus.CSV_INTERPRETING.value)
+            self.logger.info(f"Starting case-level CSV interpreting for {case_id}")
+            interpreting_success = run_case_level_csv_interpreting(case_id, case_path,
+                                                                   self.settings)
+            if not interpreting_success:
+                self.logger.error(
+                    f"Case-level CSV interpreting failed for {case_id}. Skipping.")
+                case_repo.update_case_status(case_id, CaseStatus.FAILED,
+                                             error_message="CSV interpreting failed.")
+                case_repo.update_unfinished_beams_status(case_id, BeamStatus.FAILED.value)
+                return None
+        return beam_jobs
+
+    def _dispatch_case(self, case_id: str, case_path: Path, beam_jobs: list) -> None:
+        """Generates the TPS file, uploads the case and submits its beam workers.
+        Args:
+            case_id (str): The case identifier.
+            case_path (Path): The case directory.
+            beam_jobs (list): The beam jobs returned by preprocessing.
+        """
+        with DatabaseConnection(db_path=self.settings.database_path,
+                                config=self.settings.database,
+                                logger=self.logger) as db_conn:
+            case_repo = CaseRepository(db_conn, self.logger)
+            # Step 3: Generate TPS file with dynamic GPU assignments
+            case_repo.update_unfinished_beams_status(case_id,
+                                                     BeamStatus.TPS_GENERATION.value)
+            self.logger.info(f"Starting case-level TPS generation for {case_id}")
+            # The TPS file numbers beams by position within the whole case, so a
+            # resumed case still describes all of its beams.
+            beam_count = len(case_repo.get_beams_for_case(case_id))
+            gpu_assignments = run_case_level_tps_generation(case_id, case_path, beam_count,
+                                                            self.settings)
+            if not gpu_assignments:
+                self.logger.error(
+                    f"Case-level TPS generation failed for {case_id}. Skipping.")
+                case_repo.update_case_status(case_id, CaseStatus.FAILED,
+                                             error_message="TPS generation failed.")
+                case_repo.update_unfinished_beams_status(case_id, BeamStatus.FAILED.value)
+                return
+
+            # Step 4: Run case-level file upload to HPC
+            case_repo.update_unfinished_beams_status(case_id, BeamStatus.UPLOADING.value)
+            self.logger.info(f"Starting case-level file upload for {case_id}")
+            upload_success = run_case_level_upload(case_id, case_path, self.settings)
+            if not upload_success:
+                self.logger.error(f"Case-level upload failed for {case_id}. Skipping.")
+                case_repo.update_case_status(case_id, CaseStatus.FAILED,
+                                             error_message="File upload failed.")
+                case_repo.update_unfinished_beams_status(case_id, BeamStatus.FAILED.value)
+                return
+
+            # Step 5: Dispatch individual workers for simulation
+            # Workers will pick this up
+            case_repo.update_unfinished_beams_status(case_id, BeamStatus.PENDING.value)
+            self.logger.info(f"Dispatching workers for case: {case_id}")
+            for job in beam_jobs:
+                beam_id = job["beam_id"]
+                beam_path = job["beam_path"]
+                if not self._acquire_slot(self._beam_slots):
+                    self.logger.warning("Shutdown requested; not submitting remaining "
+                                        f"beams for case {case_id}")
+                    return
+                self.logger.info(f"Submitting beam worker for: {beam_id}")
+                try:
+                    future = self._submit_beam(beam_id, beam_path)
+                except Exception:
+                    self._beam_slots.release()
+                    raise
+                with self._futures_lock:
+                    self.active_futures.add(future)
+                future.add_done_callback(functools.partial(self._on_beam_done, beam_id))
+
+    def _submit_beam(self, beam_id: str, beam_path: Path) -> Future:
+        """Submits a beam worker, replacing the process pool once if it is broken.
+        A worker process that dies abruptly (e.g. killed for running out of memory)
+        breaks the whole pool, and every later submission would fail. Callers hold
+        the dispatch lock, so only one thread ever replaces the pool.
+        Args:
+            beam_id (str): The beam identifier.
+            beam_path (Path): The beam directory.
+        Returns:
+            Future: The future of the submitted worker.
+        """
+        try:
+            return self.executor.submit(worker_main, beam_id=beam_id, beam_path=beam_path)
+        except BrokenProcessPool:
+            self.logger.error("Beam worker pool is broken; starting a new pool",
+                              {"beam_id": beam_id})
+            broken = self.executor
+            self.executor = self._create_beam_pool()
+            broken.shutdown(wait=False)
+            return self.executor.submit(worker_main, beam_id=beam_id, beam_path=beam_path)
+
+    def _acquire_slot(self, slots: threading.BoundedSemaphore) -> bool:
+        """Waits for a free slot, giving up if shutdown is requested meanwhile.
+        The slot semaphores keep the prep pool's work queue and the process pool's
+        call queue short when cases arrive faster than they are processed.
+        Args:
+            slots (threading.BoundedSemaphore): The semaphore to take a slot from.
+        Returns:
+            bool: True once a slot is held, False if shutdown was requested first.
+        """
+        while not slots.acquire(timeout=self.QUEUE_POLL_SECONDS):
+            if self.shutdown_event.is_set():
+                return False
+        return True
+
+    def _on_beam_done(self, beam_id: str, future: Future) -> None:
+        """Logs the outcome of a finished beam worker.
+        Called by the executor as a done-callback, so completions are reported as
+        soon as they happen instead of being polled for.
+        Args:
+            beam_id (str): The beam the worker was processing.
+            future (Future): The finished worker future.
+        """
+        with self._futures_lock:
+            self.active_futures.discard(future)
+        self._beam_slots.release()
+        try:
+            future.result()  # Raise exception if worker failed
+            self.logger.info(f"Beam worker {beam_id} completed successfully")
+        except Exception as e:
+            self.logger.error(f"Beam worker {beam_id} failed", {"error": str(e)})
+
+    def _start_services(self) -> None:
+        """Starts the file watcher, dashboard and GPU monitor concurrently.
+        Their set-up (watch registration, UI process spawn, SSH connection) is
+        independent, so overlapping it shortens startup. Each starter logs and
+        swallows its own failures.
+        """
+        starters = (self.start_file_watcher, self.start_dashboard, self.start_gpu_monitor)
+        with ThreadPoolExecutor(max_workers=len(starters),
+                                thread_name_prefix="startup") as pool:
+            for future in [pool.submit(start) for start in starters]:
+                future.result()
 
     def _monitor_services(self) -> None:
         """Periodically monitors the health of critical background services."""
@@ -402,13 +876,21 @@ class MQIApplication:
             self.shutdown_event.wait(timeout=30)  # Check every 30 seconds
 
     def shutdown(self) -> None:
-        """Performs a graceful shutdown of all application components."""
+        """Performs a graceful shutdown of all application components.
+        Safe to call more than once; only the first call does any work.
+        """
+        if self._shutdown_done.is_set():
+            return
+        self._shutdown_done.set()
         self.logger.info("Shutting down MQI Communicator")
         self.shutdown_event.set()
         # Stop file watcher
         if self.observer:
             self.observer.stop()
-            self.observer.join()
+            # A watcher stuck on an unresponsive share must not hold up shutdown.
+            self.observer.join(timeout=5.0)
+            if self.observer.is_alive():
+                self.logger.warning("File watcher did not stop within 5 seconds")
         # Wait for monitor thread to finish
         if self.service_monitor_thread and self.service_monitor_thread.is_alive():
             self.logger.info("Waiting for service monitor to stop...")
@@ -417,8 +899,9 @@ class MQIApplication:
         if self.gpu_monitor:
             self.logger.info("Stopping GPU monitor.")
             self.gpu_monitor.stop()
-        if self.monitor_db_connection:
-            self.monitor_db_connection.close()
+        if self.db_connection:
+            record_scan_marker(self.settings, self.logger, self.db_connection)
+            self.db_connection.close()
         # Stop dashboard UI process
         if self.ui_process_manager:
             self.ui_process_manager.stop()
@@ -433,13 +916,13 @@ class MQIApplication:
             # Initialize core components
             self.initialize_logging()
             self.initialize_database()
+            # Start monitoring and UI. The watcher goes first so that no case
+            # created during the startup scan is missed.
+            self._start_services()
             # Scan for existing cases that haven't been processed yet
             self.logger.info("Scanning for existing cases at startup")
-            scan_existing_cases(self.case_queue, self.settings, self.logger)
-            # Start monitoring and UI
-            self.start_file_watcher()
-            self.start_dashboard()
-            self.start_gpu_monitor()
+            scan_existing_cases(self.case_queue, self.settings, self.logger,
+                                self.db_connection, self.case_handler)
 
             # Start a background thread to monitor services
             self.service_monitor_thread = threading.Thread(target=self._monitor_services, daemon=True)
@@ -470,7 +953,10 @@ def setup_signal_handlers(app: MQIApplication) -> None:
             app.logger.info(message.strip())
         else:
             print(message)
-        app.shutdown()
+        # Unwind through run(), whose finally block performs the shutdown. Calling
+        # shutdown() here could block on the case queue's lock if the signal
+        # arrived while the main thread held it.
+        app.shutdown_event.set()
         sys.exit(0)
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
@@ -13,6 +13,10 @@ structures.
 # ===== DATABASE SCHEMA CONSTANTS =====
 # These define the application's data structure
 DB_SCHEMA_VERSION = "1.0"
+# Stamped into SQLite's PRAGMA user_version once the schema is in place. Derived
+# from DB_SCHEMA_VERSION so the two cannot drift; bump its major part whenever
+# init_db's DDL or migrations change.
+DB_SCHEMA_USER_VERSION = int(DB_SCHEMA_VERSION.split(".")[0])
 CASES_TABLE_NAME = "cases"
 GPU_RESOURCES_TABLE_NAME = "gpu_resources"
 WORKFLOW_HISTORY_TABLE_NAME = "workflow_history"
@@ -23,6 +27,7 @@ DICOM_FILE_EXTENSIONS = [".dcm", ".dicom"]
 TPS_INPUT_FILE_NAME = "moqui_tps.in"
 TPS_OUTPUT_FILE_PATTERN = "dose_*.raw"
 LOG_FILE_EXTENSIONS = [".log", ".out", ".err"]
+SCAN_MARKER_FILENAME = ".last_scan_mtime"  # Kept next to the database
 
 # Required input files for case processing
 REQUIRED_CASE_FILES = [
@@ -9,14 +9,60 @@ and provides a `Settings` class to load configuration from
 environment variables and a YAML file.
 """
 
+import copy
 from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
-from typing import Dict, Any, Optional
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional, Tuple
 import os
+import sys
 import yaml
 
+# Prefer the libyaml-backed loader when PyYAML was built with it; the pure-Python
+# SafeLoader is an order of magnitude slower on the full config.yaml.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
-@dataclass
+# The config sections have a fixed field set, so drop the per-instance __dict__
+# where the interpreter supports it (dataclass slots= needs Python 3.10+).
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Parsed config files keyed by absolute path -> (st_mtime_ns, data). Building
+# several Settings from the same unchanged file only parses it once.
+_PARSE_CACHE: Dict[str, Tuple[int, Any]] = {}
+
+
+def _load_yaml_cached(config_path: Path) -> Any:
+    """Parse a YAML file, reusing the previous result while its mtime is unchanged.
+
+    Args:
+        config_path (Path): Path to the YAML file.
+
+    Returns:
+        Any: A private deep copy of the parsed document, safe for the caller to keep.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+    """
+    # abspath is purely lexical; Path.resolve() would lstat every component.
+    key = os.path.abspath(config_path)
+    cached = _PARSE_CACHE.get(key)
+    if cached is None or cached[0] != os.stat(key).st_mtime_ns:
+        # Read through one raw fd: fstat gives the size and an mtime that
+        # matches the bytes actually parsed, with no buffered/text wrapper.
+        fd = os.open(key, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+        try:
+            st = os.fstat(fd)
+            raw = os.read(fd, st.st_size)
+        finally:
+            os.close(fd)
+        # PyYAML detects the UTF-8/16 encoding and BOM from the bytes itself.
+        cached = (st.st_mtime_ns, yaml.load(raw, Loader=_YAML_LOADER))
+        _PARSE_CACHE[key] = cached
+    return copy.deepcopy(cached[1])
+
+
+@dataclass(**_SLOTS)
 class DatabaseConfig:
     """Configuration for database settings."""
     db_path: Path
@@ -29,7 +75,7 @@ class DatabaseConfig:
     synchronous_mode: str = "NORMAL"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ProcessingConfig:
     """Configuration for processing settings."""
     max_workers: int = 4
@@ -37,9 +83,11 @@ class ProcessingConfig:
     scan_interval_seconds: int = 60
     polling_interval_seconds: int = 300
     local_execution_timeout_seconds: int = 300
+    case_queue_maxsize: int = 1024  # Producers block once this many items are queued
+    pin_workers: bool = False  # Pin each beam worker process to one CPU (Linux only)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class GpuConfig:
     """Configuration for GPU resource management."""
     monitor_interval: int = 30  # seconds
@@ -49,7 +97,7 @@ class GpuConfig:
     gpu_monitor_command: str = "nvidia-smi"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class LoggingConfig:
     """Configuration for logging settings."""
     log_level: str = "INFO"
@@ -60,7 +108,7 @@ class LoggingConfig:
     timezone_hours: int = 9  # Seoul timezone (UTC+9)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class UIConfig:
     """Configuration for UI display settings."""
     refresh_interval: int = 2  # seconds
@@ -70,14 +118,22 @@ class UIConfig:
     auto_start: bool = True
 
 
-@dataclass
+@dataclass(**_SLOTS)
+class WatcherConfig:
+    """Configuration for the case directory watcher."""
+    backend: str = "auto"  # "auto", "native" or "polling"; auto polls network filesystems
+    poll_interval_seconds: float = 30.0  # Used only when the scan directory is polled
+    debounce_ms: int = 500  # Quiet period before detected cases are queued; 0 disables
+
+
+@dataclass(**_SLOTS)
 class HandlerConfig:
     """Configuration for local and remote command handlers."""
     command_timeout: int = 300  # seconds
     ssh_timeout: int = 60  # seconds
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class RetryPolicyConfig:
     """Configuration for retry policy settings."""
     max_retries: int = 3
@@ -85,6 +141,62 @@ class RetryPolicyConfig:
     max_delay_seconds: int = 60
     backoff_multiplier: float = 2.0
 
+
+def _env_bool(value: str) -> bool:
+    """Parse an environment flag; only "true" (any case) enables it."""
+    return value.lower() == "true"
+
+
+# Environment overrides, applied before the YAML file:
+# Settings attribute, config class, ((field, env var, parser, default), ...).
+_ENV_SPEC = (
+    ("database", DatabaseConfig, (
+        ("db_path", "MQI_DB_PATH", Path, "database/mqi.db"),
+        ("timeout", "MQI_DB_TIMEOUT", int, "30"),
+        ("journal_mode", "MQI_DB_JOURNAL_MODE", str, "WAL"),
+        ("synchronous", "MQI_DB_SYNCHRONOUS", str, "NORMAL"),
+        ("cache_size", "MQI_DB_CACHE_SIZE", int, "-2000"),
+    )),
+    ("processing", ProcessingConfig, (
+        ("max_workers", "MQI_MAX_WORKERS", int, "4"),
+        ("case_timeout", "MQI_CASE_TIMEOUT", int, "3600"),
+        ("case_queue_maxsize", "MQI_CASE_QUEUE_MAXSIZE", int, "1024"),
+        ("pin_workers", "MQI_PIN_WORKERS", _env_bool, "false"),
+    )),
+    ("gpu", GpuConfig, (
+        ("monitor_interval", "MQI_GPU_MONITOR_INTERVAL", int, "30"),
+        ("allocation_timeout", "MQI_GPU_ALLOCATION_TIMEOUT", int, "300"),
+        ("memory_threshold", "MQI_GPU_MEMORY_THRESHOLD", float, "0.9"),
+        ("temperature_threshold", "MQI_GPU_TEMP_THRESHOLD", int, "85"),
+    )),
+    ("logging", LoggingConfig, (
+        ("log_level", "MQI_LOG_LEVEL", str, "INFO"),
+        ("log_dir", "MQI_LOG_DIR", Path, "logs"),
+        ("max_file_size", "MQI_LOG_MAX_SIZE", int, "10"),
+        ("backup_count", "MQI_LOG_BACKUP_COUNT", int, "5"),
+        ("structured_logging", "MQI_STRUCTURED_LOGGING", _env_bool, "true"),
+        ("timezone_hours", "MQI_TIMEZONE_HOURS", int, "9"),
+    )),
+    ("ui", UIConfig, (
+        ("refresh_interval", "MQI_UI_REFRESH_INTERVAL", int, "2"),
+        ("max_log_entries", "MQI_UI_MAX_LOG_ENTRIES", int, "100"),
+        ("enable_colors", "MQI_UI_ENABLE_COLORS", _env_bool, "true"),
+        ("show_gpu_details", "MQI_UI_SHOW_GPU_DETAILS", _env_bool, "true"),
+    )),
+    ("file_watcher", WatcherConfig, (
+        ("backend", "MQI_WATCHER_BACKEND", str, "auto"),
+        ("poll_interval_seconds", "MQI_WATCHER_POLL_INTERVAL", float, "30"),
+        ("debounce_ms", "MQI_WATCHER_DEBOUNCE_MS", int, "500"),
+    )),
+    ("retry_policy", RetryPolicyConfig, (
+        ("max_retries", "MQI_RETRY_POLICY_MAX_RETRIES", int, "3"),
+        ("initial_delay_seconds", "MQI_RETRY_POLICY_INITIAL_DELAY", int, "5"),
+        ("max_delay_seconds", "MQI_RETRY_POLICY_MAX_DELAY", int, "60"),
+        ("backoff_multiplier", "MQI_RETRY_POLICY_BACKOFF_MULTIPLIER", float, "2.0"),
+    )),
+)
+
+
 class Settings:
     """Main configuration class that loads and manages all settings.
 
@@ -92,6 +204,19 @@ class Settings:
     and provides methods to access the configuration values.
     """
 
+    # Section objects built by _load_from_env from _ENV_SPEC.
+    database: DatabaseConfig
+    processing: ProcessingConfig
+    gpu: GpuConfig
+    logging: LoggingConfig
+    ui: UIConfig
+    file_watcher: WatcherConfig
+    retry_policy: RetryPolicyConfig
+
+    # cached_property values computed eagerly by _resolve_paths().
+    _RESOLVED_PATHS = ("_case_directories", "_case_dir_templates", "database_path",
+                       "_executables")
+
     def __init__(self, config_path: Optional[Path] = None):
         """Initialize settings from environment variables and config file.
 
@@ -99,70 +224,43 @@ class Settings:
             config_path (Optional[Path]): Optional path to the configuration file.
         """
         self._load_from_env()
-        if config_path and config_path.exists():
+        if config_path:
             self._load_from_file(config_path)
+        self._resolve_paths()
+
+    def _resolve_paths(self) -> None:
+        """Resolve the YAML-derived paths once, right after loading.
+
+        The resolved values are plain attributes from then on, so they are also
+        carried in the pickled Settings that worker processes receive.
+        """
+        for name in self._RESOLVED_PATHS:
+            # Reading a cached_property computes and stores its value.
+            getattr(self, name)
 
     def _load_from_env(self) -> None:
         """Load configuration from environment variables."""
-        # Database configuration
-        self.database = DatabaseConfig(
-            db_path=Path(os.getenv("MQI_DB_PATH", "database/mqi.db")),
-            timeout=int(os.getenv("MQI_DB_TIMEOUT", "30")),
-            journal_mode=os.getenv("MQI_DB_JOURNAL_MODE", "WAL"),
-            synchronous=os.getenv("MQI_DB_SYNCHRONOUS", "NORMAL"),
-            cache_size=int(os.getenv("MQI_DB_CACHE_SIZE", "-2000"))
-        )
-        
-        # Processing configuration
-        self.processing = ProcessingConfig(
-            max_workers=int(os.getenv("MQI_MAX_WORKERS", "4")),
-            case_timeout=int(os.getenv("MQI_CASE_TIMEOUT", "3600")),
-        )
-        
-        # GPU configuration
-        self.gpu = GpuConfig(
-            monitor_interval=int(os.getenv("MQI_GPU_MONITOR_INTERVAL", "30")),
-            allocation_timeout=int(os.getenv("MQI_GPU_ALLOCATION_TIMEOUT", "300")),
-            memory_threshold=float(os.getenv("MQI_GPU_MEMORY_THRESHOLD", "0.9")),
-            temperature_threshold=int(os.getenv("MQI_GPU_TEMP_THRESHOLD", "85"))
-        )
-        
-        # Logging configuration
-        self.logging = LoggingConfig(
-            log_level=os.getenv("MQI_LOG_LEVEL", "INFO"),
-            log_dir=Path(os.getenv("MQI_LOG_DIR", "logs")),
-            max_file_size=int(os.getenv("MQI_LOG_MAX_SIZE", "10")),
-            backup_count=int(os.getenv("MQI_LOG_BACKUP_COUNT", "5")),
-            structured_logging=os.getenv("MQI_STRUCTURED_LOGGING", "true").lower() == "true",
-            timezone_hours=int(os.getenv("MQI_TIMEZONE_HOURS", "9"))
-        )
-        
-        # UI configuration
-        self.ui = UIConfig(
-            refresh_interval=int(os.getenv("MQI_UI_REFRESH_INTERVAL", "2")),
-            max_log_entries=int(os.getenv("MQI_UI_MAX_LOG_ENTRIES", "100")),
-            enable_colors=os.getenv("MQI_UI_ENABLE_COLORS", "true").lower() == "true",
-            show_gpu_details=os.getenv(
-                "MQI_UI_SHOW_GPU_DETAILS", "true").lower() == "true"
-        )
-        # Retry Policy configuration
-        self.retry_policy = RetryPolicyConfig(
-            max_retries=int(os.getenv("MQI_RETRY_POLICY_MAX_RETRIES", "3")),
-            initial_delay_seconds=int(os.getenv("MQI_RETRY_POLICY_INITIAL_DELAY", "5")),
-            max_delay_seconds=int(os.getenv("MQI_RETRY_POLICY_MAX_DELAY", "60")),
-            backoff_multiplier=float(os.getenv("MQI_RETRY_POLICY_BACKOFF_MULTIPLIER", "2.0"))
-        )
+        environ = os.environ
+        for attr, config_cls, fields in _ENV_SPEC:
+            setattr(self, attr, config_cls(**{
+                field: parse(environ.get(env_var, default))
+                for field, env_var, parse, default in fields
+            }))
 
     def _load_from_file(self, config_path: Path) -> None:
         """Load configuration from a YAML file.
 
+        A missing file is not an error; the env/default values are kept.
+
         Args:
             config_path (Path): Path to the YAML configuration file.
         """
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                config_data = yaml.safe_load(f)
-            
+            try:
+                config_data = _load_yaml_cached(config_path)
+            except FileNotFoundError:
+                return
+
             # Store the full config for access to paths, executables, etc.
             self._yaml_config = config_data
             # Override with YAML values if present
@@ -188,11 +286,23 @@ class Settings:
                     'polling_interval_seconds', 300)
                 self.processing.local_execution_timeout_seconds = app_config.get(
                     'local_execution_timeout_seconds', 300)
+                self.processing.case_queue_maxsize = app_config.get(
+                    'case_queue_maxsize', self.processing.case_queue_maxsize)
+                self.processing.pin_workers = app_config.get(
+                    'pin_workers', self.processing.pin_workers)
             if 'dashboard' in config_data:
                 dash_config = config_data['dashboard']
                 self.ui.auto_start = dash_config.get('auto_start', True)
                 self.ui.refresh_interval = dash_config.get(
                     'refresh_interval_seconds', self.ui.refresh_interval)
+            if 'file_watcher' in config_data:
+                watcher_config = config_data['file_watcher']
+                self.file_watcher.backend = watcher_config.get(
+                    'backend', self.file_watcher.backend)
+                self.file_watcher.poll_interval_seconds = watcher_config.get(
+                    'poll_interval_seconds', self.file_watcher.poll_interval_seconds)
+                self.file_watcher.debounce_ms = watcher_config.get(
+                    'debounce_ms', self.file_watcher.debounce_ms)
             if 'curator' in config_data:
                 curator_config = config_data['curator']
                 self.gpu.monitor_interval = curator_config.get(
@@ -230,11 +340,24 @@ class Settings:
             print(f"Warning: Could not load config file {config_path}: {e}")
             self._yaml_config = {}
 
-    def get_case_directories(self) -> Dict[str, Path]:
+    def get_case_directories(self) -> Mapping[str, Path]:
         """Get configured case directories.
 
         Returns:
-            Dict[str, Path]: A dictionary of case directory paths.
+            Mapping[str, Path]: A read-only mapping of case directory paths.
+        """
+        return self.case_directories
+
+    @property
+    def case_directories(self) -> Mapping[str, Path]:
+        """Read-only view of the case directories, resolved once per Settings."""
+        return MappingProxyType(self._case_directories)
+
+    @cached_property
+    def _case_directories(self) -> Dict[str, Path]:
+        """Resolve the case directories once; the YAML config never changes after load.
+
+        The plain dict is what gets cached so Settings stays picklable for workers.
         """
         if hasattr(self, '_yaml_config') and 'paths' in self._yaml_config:
             paths_config = self._yaml_config['paths']
@@ -257,12 +380,38 @@ class Settings:
             "failed": Path(os.getenv("MQI_FAILED_DIR", "cases/failed"))
         }
     
+    def get_case_path(self, kind: str, case_id: str) -> Optional[Path]:
+        """Get a per-case directory, such as ``csv_output``, for one case.
+
+        Args:
+            kind (str): The case directory key, e.g. "csv_output" or "final_dicom".
+            case_id (str): The case identifier substituted for ``{case_id}``.
+
+        Returns:
+            Optional[Path]: The directory for the case, or None if ``kind`` is not
+                configured.
+        """
+        template = self._case_dir_templates.get(kind)
+        if template is None:
+            return None
+        return Path(template.format(case_id=case_id))
+
+    @cached_property
+    def _case_dir_templates(self) -> Dict[str, str]:
+        """The case directories as ``{case_id}`` format strings, converted once."""
+        return {kind: str(path) for kind, path in self._case_directories.items()}
+
     def get_database_path(self) -> Path:
         """Get the database path from the YAML config.
 
         Returns:
             Path: The path to the database file.
         """
+        return self.database_path
+
+    @cached_property
+    def database_path(self) -> Path:
+        """Database file path, resolved once from the YAML config."""
         if hasattr(self, '_yaml_config') and 'paths' in self._yaml_config:
             paths_config = self._yaml_config['paths']
             base_dir = paths_config.get('base_directory', '')
@@ -273,12 +422,17 @@ class Settings:
                 return Path(db_path)
         return self.database.db_path
 
-    def get_executables(self) -> Dict[str, str]:
+    def get_executables(self) -> Mapping[str, str]:
         """Get executable paths from the YAML config.
 
         Returns:
-            Dict[str, str]: A dictionary of executable paths.
+            Mapping[str, str]: A read-only mapping of executable paths.
         """
+        return MappingProxyType(self._executables)
+
+    @cached_property
+    def _executables(self) -> Dict[str, str]:
+        """Format the executable paths once against the base directory."""
         if hasattr(self, '_yaml_config') and 'executables' in self._yaml_config:
             executables = self._yaml_config['executables']
             base_dir = self._yaml_config.get(
@@ -298,25 +452,25 @@ class Settings:
             }
         return {}
 
-    def get_hpc_connection(self) -> Dict[str, Any]:
+    def get_hpc_connection(self) -> Mapping[str, Any]:
         """Get HPC connection configuration from the YAML config.
 
         Returns:
-            Dict[str, Any]: A dictionary of HPC connection settings.
+            Mapping[str, Any]: A read-only mapping of HPC connection settings.
         """
         if hasattr(self, '_yaml_config') and 'hpc_connection' in self._yaml_config:
-            return self._yaml_config['hpc_connection']
-        return {}
+            return MappingProxyType(self._yaml_config['hpc_connection'])
+        return MappingProxyType({})
 
-    def get_hpc_paths(self) -> Dict[str, str]:
+    def get_hpc_paths(self) -> Mapping[str, str]:
         """Get HPC paths from the YAML config.
 
         Returns:
-            Dict[str, str]: A dictionary of HPC paths.
+            Mapping[str, str]: A read-only mapping of HPC paths.
         """
         if hasattr(self, '_yaml_config') and 'paths' in self._yaml_config:
-            return self._yaml_config['paths'].get('hpc', {})
-        return {}
+            return MappingProxyType(self._yaml_config['paths'].get('hpc', {}))
+        return MappingProxyType({})
 
     def get_base_directory(self) -> str:
         """Get the base directory from the YAML config.
@@ -328,23 +482,25 @@ class Settings:
             return self._yaml_config['paths'].get('base_directory', '')
         return ''
 
-    def get_moqui_tps_parameters(self) -> Dict[str, Any]:
+    def get_moqui_tps_parameters(self) -> Mapping[str, Any]:
         """Get MOQUI TPS parameters from the YAML config.
 
+        Callers that need to modify the parameters should take a ``.copy()``.
+
         Returns:
-            Dict[str, Any]: A dictionary of MOQUI TPS parameters.
+            Mapping[str, Any]: A read-only mapping of MOQUI TPS parameters.
         """
         if hasattr(self, '_yaml_config') and 'moqui_tps_parameters' in self._yaml_config:
-            return self._yaml_config['moqui_tps_parameters']
-        return {}
+            return MappingProxyType(self._yaml_config['moqui_tps_parameters'])
+        return MappingProxyType({})
 
     @property
-    def command_templates(self) -> Dict[str, str]:
+    def command_templates(self) -> Mapping[str, str]:
         """Get command templates from the YAML config.
 
         Returns:
-            Dict[str, str]: A dictionary of command templates.
+            Mapping[str, str]: A read-only mapping of command templates.
         """
         if hasattr(self, '_yaml_config') and 'command_templates' in self._yaml_config:
-            return self._yaml_config['command_templates']
-        return {}
\ No newline at end of file
+            return MappingProxyType(self._yaml_config['command_templates'])
+        return MappingProxyType({})
\ No newline at end of file
@@ -69,11 +69,9 @@ def run_case_level_csv_interpreting(
         )
 
         # Get the configured output directory for CSVs and ensure it exists
-        case_dirs = settings.get_case_directories()
-        csv_output_dir_template = case_dirs.get("csv_output")
-        if not csv_output_dir_template:
+        csv_output_dir = settings.get_case_path("csv_output", case_id)
+        if csv_output_dir is None:
             raise ProcessingError("'csv_output_directory' not found in configuration.")
-        csv_output_dir = Path(str(csv_output_dir_template).format(case_id=case_id))
         csv_output_dir.mkdir(parents=True, exist_ok=True)
 
         # The output of the case-level interpreter should go into the configured csv_output directory.
@@ -169,9 +167,9 @@ def run_case_level_upload(case_id: str, case_path: Path, settings: Settings) ->
         )
 
         # Get CSV files from the configured output directory
-        case_dirs = settings.get_case_directories()
-        csv_output_dir_template = case_dirs.get("csv_output")
-        csv_output_dir = Path(str(csv_output_dir_template).format(case_id=case_id))
+        csv_output_dir = settings.get_case_path("csv_output", case_id)
+        if csv_output_dir is None:
+            raise ProcessingError("'csv_output_directory' not found in configuration.")
         csv_files = list(csv_output_dir.glob("*.csv"))
 
         if not csv_files:
@@ -31,6 +31,12 @@ class TpsGenerator:
         self.settings = settings
         self.logger = logger
         self.base_parameters = settings.get_moqui_tps_parameters()
+        # Resolve the required-parameter list once instead of per generated file.
+        tps_config = getattr(settings, '_yaml_config', {}).get('tps_generator', {})
+        self.required_params = tuple(
+            tps_config.get('validation', {}).get('required_params', [])
+            # Default required parameters if not configured
+            or ('GPUID', 'DicomDir', 'logFilePath', 'OutputDir'))
 
     def generate_tps_file_with_gpu_assignments(
         self,
@@ -228,7 +234,6 @@ class TpsGenerator:
             })
         else:
             # Use local paths for local execution
-            self.settings.get_case_directories()
             paths.update({
                 "DicomDir": str(case_path),
                 "OutputDir": str(case_path / "raw_output"),
@@ -329,18 +334,9 @@ class TpsGenerator:
             bool: True if validation passes, False otherwise.
         """
         try:
-            # Get required parameters from config
-            tps_config = self.settings._yaml_config.get('tps_generator', {})
-            validation_config = tps_config.get('validation', {})
-            required_params = validation_config.get('required_params', [])
-            if not required_params:
-                # Default required parameters if not configured
-                required_params = [
-                    'GPUID', 'DicomDir', 'logFilePath', 'OutputDir'
-                ]
             missing_params = []
             empty_params = []
-            for param in required_params:
+            for param in self.required_params:
                 if param not in parameters:
                     missing_params.append(param)
                 elif not parameters[param] and parameters[param] != 0:  # Allow GPUID=0
@@ -4,7 +4,10 @@
 # =====================================================================================
 """Main entry point for a worker process that handles a single beam."""
 
+import os
+import pickle
 from pathlib import Path
+from typing import Optional
 
 from src.database.connection import DatabaseConnection
 from src.repositories.case_repo import CaseRepository
@@ -19,7 +22,41 @@ from src.core.tps_generator import TpsGenerator
 from src.config.settings import Settings
 
 
-def worker_main(beam_id: str, beam_path: Path, settings: Settings) -> None:
+# Settings installed once per worker process by init_worker.
+_WORKER_SETTINGS: Optional[Settings] = None
+
+
+def init_worker(settings_blob: bytes, worker_counter=None) -> None:
+    """Process pool initializer that unpickles the settings once per worker process.
+
+    Args:
+        settings_blob (bytes): The pickled Settings object.
+        worker_counter: Optional shared multiprocessing.Value counting started
+            workers. When given, the worker is pinned to a single CPU.
+    """
+    global _WORKER_SETTINGS
+    _WORKER_SETTINGS = pickle.loads(settings_blob)
+    if worker_counter is not None:
+        _pin_to_cpu(worker_counter)
+
+
+def _pin_to_cpu(worker_counter) -> None:
+    """Pins the current process to one of its allowed CPUs, round-robin by start order.
+
+    Keeping a worker on one core keeps its working set in that core's caches.
+    Child processes inherit the affinity. Requires os.sched_setaffinity (Linux).
+
+    Args:
+        worker_counter: Shared multiprocessing.Value counting started workers.
+    """
+    with worker_counter.get_lock():
+        index = worker_counter.value
+        worker_counter.value += 1
+    cpus = sorted(os.sched_getaffinity(0))
+    os.sched_setaffinity(0, {cpus[index % len(cpus)]})
+
+
+def worker_main(beam_id: str, beam_path: Path, settings: Optional[Settings] = None) -> None:
     """Acts as the "assembly line" that creates all dependency objects for a single beam
     and injects them into the WorkflowManager to start the process.
 
@@ -28,8 +65,11 @@ def worker_main(beam_id: str, beam_path: Path, settings: Settings) -> None:
     Args:
         beam_id (str): Unique identifier for the beam.
         beam_path (Path): Path to the beam directory.
-        settings (Settings): Settings object containing all configuration.
+        settings (Optional[Settings]): Settings object containing all configuration.
+            Defaults to the settings installed by the pool initializer.
     """
+    if settings is None:
+        settings = _WORKER_SETTINGS
     logger = StructuredLogger(f"worker_{beam_id}", config=settings.logging)
 
     db_connection = None
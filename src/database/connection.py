@@ -10,6 +10,7 @@ from contextlib import contextmanager
 from pathlib import Path
 from typing import Generator, Optional
 
+from src.config.constants import DB_SCHEMA_USER_VERSION
 from src.config.settings import DatabaseConfig
 from src.domain.errors import DatabaseError
 from src.infrastructure.logging_handler import StructuredLogger
@@ -125,10 +126,20 @@ class DatabaseConnection:
     def init_db(self) -> None:
         """Initializes the database schema, creating all necessary tables and indexes.
 
+        A database already stamped with the current schema version (via
+        PRAGMA user_version) is left untouched, so repeated calls are cheap.
+
         Raises:
             DatabaseError: If schema initialization fails.
         """
         try:
+            with self._lock:
+                if not self._conn:
+                    raise DatabaseError("Database connection is not established")
+                version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+            if version == DB_SCHEMA_USER_VERSION:
+                return
+
             with self.transaction() as conn:
                 # Create cases table
                 conn.execute(
@@ -230,6 +241,9 @@ class DatabaseConnection:
                     self.logger.info("Adding gpu_index column to gpu_resources table")
                     conn.execute("ALTER TABLE gpu_resources ADD COLUMN gpu_index INTEGER DEFAULT 0")
 
+                # PRAGMA does not accept bound parameters; the value is an int constant.
+                conn.execute(f"PRAGMA user_version = {DB_SCHEMA_USER_VERSION}")
+
             self.logger.info("Database schema initialized successfully")
 
         except sqlite3.Error as e:
@@ -4,6 +4,7 @@
 # =====================================================================================
 """Defines Data Transfer Objects (DTOs) for the application's domain models."""
 
+import sys
 from dataclasses import dataclass
 from typing import Optional, Dict, Any, List
 from pathlib import Path
@@ -11,6 +12,9 @@ from datetime import datetime
 
 from src.domain.enums import CaseStatus, GpuStatus, WorkflowStep, BeamStatus
 
+# dataclass slots= needs Python 3.10+; older interpreters keep the instance __dict__.
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 @dataclass
 class CaseData:
     """Data Transfer Object for case information."""
@@ -60,6 +64,15 @@ class WorkflowStepRecord:
     error_message: Optional[str] = None
     metadata: Optional[Dict[str, Any]] = None
 
+
+@dataclass(frozen=True, **_SLOTS)
+class CaseMessage:
+    """Queue entry announcing a case directory to be processed."""
+    case_id: str
+    case_path: str
+    timestamp: int  # time.monotonic_ns() when queued; not a wall-clock time
+
+
 @dataclass
 class SystemStats:
     """Data Transfer Object for system statistics."""
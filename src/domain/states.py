@@ -15,7 +15,6 @@ if TYPE_CHECKING:
 from src.core.case_aggregator import update_case_status_from_beams
 from src.domain.enums import BeamStatus, CaseStatus, WorkflowStep
 from src.domain.errors import ProcessingError
-from pathlib import Path
 
 
 def handle_state_exceptions(func: Callable[..., Any]) -> Callable[..., Any]:
@@ -234,12 +233,11 @@ class DownloadState(WorkflowState):
         if not remote_beam_dir:
             raise ProcessingError("Remote beam directory not found in shared context.")
 
-        case_dirs = context.local_handler.settings.get_case_directories()
-        local_result_dir_template = case_dirs.get("final_dicom")
-        if not local_result_dir_template:
+        local_result_dir = context.local_handler.settings.get_case_path(
+            "final_dicom", beam.parent_case_id)
+        if local_result_dir is None:
              raise ProcessingError("`final_dicom_directory` not configured in settings.")
 
-        local_result_dir = Path(str(local_result_dir_template).format(case_id=beam.parent_case_id))
         local_beam_result_dir = local_result_dir / beam.beam_id
         local_beam_result_dir.mkdir(parents=True, exist_ok=True)
 
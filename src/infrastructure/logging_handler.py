@@ -69,12 +69,12 @@ class StructuredLogger:
         Returns:
             logging.Formatter: A logging.Formatter instance that formats logs as JSON.
         """
-        config = self.config  # Capture config for inner class
+        # Build the timezone for the configured offset (Seoul: UTC+9) once,
+        # rather than on every formatted record.
+        local_tz = timezone(timedelta(hours=self.config.timezone_hours))
         
         class JsonFormatter(logging.Formatter):
             def format(self, record):
-                # Create timezone object for configured timezone (Seoul: UTC+9)
-                local_tz = timezone(timedelta(hours=config.timezone_hours))
                 log_data = {
                     'timestamp': datetime.now(local_tz).isoformat(),
                     'logger': record.name,
@@ -7,7 +7,7 @@
 import json
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Set
 
 from src.database.connection import DatabaseConnection
 from src.domain.enums import BeamStatus, CaseStatus, WorkflowStep
@@ -22,6 +22,11 @@ class CaseRepository(BaseRepository):
     This class implements the Repository Pattern for case data access.
     """
 
+    # Keeps IN (...) lists below SQLite's default limit of 999 bound parameters.
+    IN_CLAUSE_CHUNK_SIZE = 500
+    # Beam statuses a worker never leaves; resuming a case does not touch them.
+    TERMINAL_BEAM_STATUSES = (BeamStatus.COMPLETED, BeamStatus.FAILED)
+
     def __init__(self, db_connection: DatabaseConnection, logger: StructuredLogger):
         """Initializes the case repository with an injected database connection.
 
@@ -203,6 +208,31 @@ class CaseRepository(BaseRepository):
         
         return case_ids
 
+    def get_known_case_ids(self, candidates: Sequence[str]) -> Set[str]:
+        """Returns which of the given case IDs already exist in the database.
+
+        Only the candidate IDs are looked up, in chunks that stay below SQLite's
+        bound-parameter limit, so the cost scales with the number of candidates
+        rather than the size of the 'cases' table.
+
+        Args:
+            candidates (Sequence[str]): The case IDs to look up.
+
+        Returns:
+            Set[str]: The subset of candidates that have a case record.
+        """
+        self._log_operation("get_known_case_ids", candidates=len(candidates))
+
+        known: Set[str] = set()
+        for start in range(0, len(candidates), self.IN_CLAUSE_CHUNK_SIZE):
+            chunk = tuple(candidates[start:start + self.IN_CLAUSE_CHUNK_SIZE])
+            placeholders = ",".join("?" * len(chunk))
+            query = f"SELECT case_id FROM cases WHERE case_id IN ({placeholders})"
+            rows = self._execute_query(query, chunk, fetch_all=True)
+            known.update(row["case_id"] for row in rows)
+
+        return known
+
     def record_workflow_step(
         self,
         case_id: str,
@@ -554,3 +584,27 @@ class CaseRepository(BaseRepository):
         query = "UPDATE beams SET status = ?, updated_at = CURRENT_TIMESTAMP WHERE parent_case_id = ?"
         self._execute_query(query, (beam_status_value, case_id))
         self.logger.info("Bulk updated beam statuses for case", {"case_id": case_id, "new_status": beam_status_value})
+
+    def update_unfinished_beams_status(self, case_id: str, status: str) -> None:
+        """Updates the status of a case's beams that are not in a terminal state.
+
+        Used for case-level steps, so that resuming an interrupted case does not
+        reset beams that already completed or failed.
+
+        Args:
+            case_id (str): The parent case identifier.
+            status (str): The new status for the beams (e.g., "CSV_INTERPRETING",
+                "UPLOADING").
+        """
+        self._log_operation("update_unfinished_beams_status", case_id=case_id,
+                            status=status)
+        beam_status_value = BeamStatus[status.upper()].value
+        terminal = tuple(beam_status.value for beam_status in self.TERMINAL_BEAM_STATUSES)
+        placeholders = ",".join("?" * len(terminal))
+        query = (
+            "UPDATE beams SET status = ?, updated_at = CURRENT_TIMESTAMP "
+            f"WHERE parent_case_id = ? AND status NOT IN ({placeholders})"
+        )
+        self._execute_query(query, (beam_status_value, case_id) + terminal)
+        self.logger.info("Bulk updated unfinished beam statuses for case",
+                         {"case_id": case_id, "new_status": beam_status_value})
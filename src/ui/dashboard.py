@@ -74,11 +74,10 @@ class DashboardLogger:
     
     def _create_json_formatter(self):
         """Create a JSON formatter for structured logging."""
-        config = self.config
+        local_tz = timezone(timedelta(hours=self.config.timezone_hours))
         
         class JsonFormatter(logging.Formatter):
             def format(self, record):
-                local_tz = timezone(timedelta(hours=config.timezone_hours))
                 log_data = {
                     'timestamp': datetime.now(local_tz).isoformat(),
                     'logger': record.name,
@@ -14,6 +14,13 @@ from src.infrastructure.logging_handler import StructuredLogger
 from src.domain.errors import ValidationError
 
 
+# Filesystem types (as reported in /proc/mounts) that do not deliver native
+# change notifications for remote writes.
+_NETWORK_FS_TYPES = frozenset({
+    "nfs", "nfs4", "cifs", "smbfs", "smb3", "afs", "9p", "fuse.sshfs",
+})
+
+
 class PathManager:
     """Manages file system paths and operations in a centralized, reusable way."""
 
@@ -128,6 +135,42 @@ class PathManager:
         """
         return os.access(directory_path, os.W_OK)
 
+    def is_network_filesystem(self, path: Union[str, Path]) -> bool:
+        """Checks if a path lives on a network filesystem (NFS, SMB/CIFS, UNC share).
+
+        Args:
+            path (Union[str, Path]): The path to check.
+
+        Returns:
+            bool: True if the path is on a network mount, False if it is local or unknown.
+        """
+        path_str = os.path.abspath(path)
+        if os.name == "nt":
+            drive = os.path.splitdrive(path_str)[0]
+            if drive.startswith("\\\\"):
+                return True
+            try:
+                import ctypes
+                DRIVE_REMOTE = 4
+                return ctypes.windll.kernel32.GetDriveTypeW(drive + "\\") == DRIVE_REMOTE
+            except (ImportError, AttributeError, OSError):
+                return False
+        try:
+            with open("/proc/mounts", "r") as mounts:
+                mount_table = [line.split()[1:3] for line in mounts if line.strip()]
+        except OSError:
+            return False
+        # The longest mount point that prefixes the path is the one it lives on.
+        real_path = os.path.realpath(path_str)
+        best_mount, best_type = "", ""
+        for mount_point, fs_type in mount_table:
+            mount_point = mount_point.replace("\\040", " ")
+            contains_path = (real_path == mount_point
+                             or real_path.startswith(mount_point.rstrip("/") + "/"))
+            if contains_path and len(mount_point) > len(best_mount):
+                best_mount, best_type = mount_point, fs_type
+        return best_type in _NETWORK_FS_TYPES
+
     def get_relative_path(self, path: Union[str, Path], base_path: Union[str, Path]) -> Path:
         """Gets the relative path from a base path.
 
@@ -2,6 +2,7 @@ import sqlite3
 
 import pytest
 
+from src.config.constants import DB_SCHEMA_USER_VERSION
 from src.domain.errors import DatabaseError
 
 
@@ -44,6 +45,24 @@ def test_init_db_creates_tables_and_indexes(db_connection):
             assert cursor.fetchone() is not None, f"Index '{index}' not created."
 
 
+def test_init_db_stamps_and_skips_current_schema(db_connection):
+    """
+    Tests that init_db records the schema version and skips the DDL when the
+    database is already at that version.
+    """
+    with db_connection.transaction() as conn:
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        conn.execute("DROP INDEX idx_cases_status")
+    assert version == DB_SCHEMA_USER_VERSION
+
+    db_connection.init_db()
+    with db_connection.transaction() as conn:
+        cursor = conn.execute(
+            "SELECT name FROM sqlite_master WHERE type='index' AND name='idx_cases_status'"
+        )
+        assert cursor.fetchone() is None
+
+
 def test_transaction_commit(db_connection):
     """
     Tests that a successful transaction commits the changes to the database.
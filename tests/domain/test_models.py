@@ -1,9 +1,15 @@
-from dataclasses import is_dataclass
+import copy
+import pickle
+import sys
+from dataclasses import FrozenInstanceError, is_dataclass
 from pathlib import Path
 from datetime import datetime
 
+import pytest
+
 from src.domain.models import (
     CaseData,
+    CaseMessage,
     GpuResource,
     WorkflowStepRecord,
     SystemStats,
@@ -150,3 +156,21 @@ def test_systemstats_model():
     assert stats.total_cases == 10
     assert stats.available_gpus == 1
     assert stats.last_updated == now
+
+
+def test_casemessage_model():
+    """
+    Tests that CaseMessage is an immutable, slotted queue entry.
+    """
+    message = CaseMessage(case_id="case-123", case_path="/tmp/case-123",
+                          timestamp=1_500_000_000)
+
+    assert is_dataclass(message)
+    assert message.case_id == "case-123"
+    if sys.version_info >= (3, 10):
+        assert not hasattr(message, "__dict__")
+    with pytest.raises(FrozenInstanceError):
+        message.case_id = "other"
+
+    assert pickle.loads(pickle.dumps(message)) == message
+    assert copy.deepcopy(message) == message
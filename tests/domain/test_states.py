@@ -1,5 +1,5 @@
 import pytest
-from unittest.mock import Mock, MagicMock, patch, call
+from unittest.mock import Mock, MagicMock, call
 from pathlib import Path
 
 from src.domain.states import (
@@ -219,10 +219,9 @@ def test_download_state_success(mock_context):
 
     # Mock path setup
     mock_local_result_dir = MagicMock(spec=Path)
-    mock_context.local_handler.settings.get_case_directories.return_value = {"final_dicom": "/results/{case_id}"}
-    with patch('src.domain.states.Path', return_value=mock_local_result_dir):
-        (mock_local_result_dir / mock_context.id / "output.raw").exists.return_value = True
-        next_state = state.execute(mock_context)
+    mock_context.local_handler.settings.get_case_path.return_value = mock_local_result_dir
+    (mock_local_result_dir / mock_context.id / "output.raw").exists.return_value = True
+    next_state = state.execute(mock_context)
 
     mock_context.remote_handler.cleanup_remote_directory.assert_called_once_with("/remote/beam/dir")
     assert isinstance(next_state, PostprocessingState)
@@ -237,10 +236,9 @@ def test_download_state_main_file_missing(mock_context):
 
     # Mock path setup
     mock_local_result_dir = MagicMock(spec=Path)
-    mock_context.local_handler.settings.get_case_directories.return_value = {"final_dicom": "/results/{case_id}"}
-    with patch('src.domain.states.Path', return_value=mock_local_result_dir):
-        (mock_local_result_dir / mock_context.id / "output.raw").exists.return_value = False
-        next_state = state.execute(mock_context)
+    mock_context.local_handler.settings.get_case_path.return_value = mock_local_result_dir
+    (mock_local_result_dir / mock_context.id / "output.raw").exists.return_value = False
+    next_state = state.execute(mock_context)
 
     original_error = "Main output file 'output.raw' was not downloaded."
     expected_error = f"Error in state '{state.get_state_name()}' for beam '{mock_context.id}': {original_error}"
@@ -46,6 +46,15 @@ def test_get_all_case_ids(case_repo):
     ids = case_repo.get_all_case_ids()
     assert len(ids) == 2 and "case_id_1" in ids
 
+
+def test_get_known_case_ids(case_repo):
+    """Tests that only candidate IDs present in the database are returned."""
+    case_repo.add_case("case_id_1", Path("/path/1"))
+    case_repo.add_case("case_id_2", Path("/path/2"))
+    candidates = ["case_id_2", "case_id_3"] + [f"unknown_{i}" for i in range(1200)]
+    assert case_repo.get_known_case_ids(candidates) == {"case_id_2"}
+    assert case_repo.get_known_case_ids([]) == set()
+
 def test_record_and_get_workflow_steps(case_repo):
     """Tests recording and retrieving workflow steps."""
     case_id = "case_workflow_001"
@@ -124,3 +133,18 @@ def test_assign_hpc_job_id_to_beam(case_repo):
 
     beam = case_repo.get_beam(beam_id)
     assert beam.hpc_job_id == hpc_job_id
+
+
+def test_update_unfinished_beams_status(case_repo):
+    """Tests that bulk updates for a case leave completed and failed beams alone."""
+    case_id = "parent_case_05"
+    case_repo.add_case(case_id, Path(f"/path/to/{case_id}"))
+    statuses = [BeamStatus.COMPLETED, BeamStatus.FAILED, BeamStatus.HPC_RUNNING]
+    for n, status in enumerate(statuses):
+        beam_id = f"{case_id}_beam{n}"
+        case_repo.create_beam_record(beam_id, case_id, Path(f"/path/to/{case_id}/beam{n}"))
+        case_repo.update_beam_status(beam_id, status)
+
+    case_repo.update_unfinished_beams_status(case_id, BeamStatus.UPLOADING.value)
+    statuses = [beam.status for beam in case_repo.get_beams_for_case(case_id)]
+    assert statuses == [BeamStatus.COMPLETED, BeamStatus.FAILED, BeamStatus.UPLOADING]
@@ -1,5 +1,6 @@
 # Tests for src/config/constants.py and src/config/settings.py
 import os
+import pickle
 from pathlib import Path
 from unittest.mock import patch
 
@@ -185,12 +186,14 @@ def test_config_file(tmp_path):
         },
         "application": {
             "max_workers": 16,
-            "scan_interval_seconds": 30
+            "scan_interval_seconds": 30,
+            "pin_workers": True
         },
         "paths": {
             "base_directory": "/mnt/data",
             "local": {
                 "scan_directory": "{base_directory}/input",
+                "csv_output_directory": "{base_directory}/csv/{case_id}",
                 "database_path": "{base_directory}/db/prod.db"
             },
             "hpc": {
@@ -206,6 +209,11 @@ def test_config_file(tmp_path):
         },
         "moqui_tps_parameters": {
             "SomeSetting": "SomeValue"
+        },
+        "file_watcher": {
+            "backend": "polling",
+            "poll_interval_seconds": 45,
+            "debounce_ms": 250
         }
     }
     config_path = tmp_path / "config.yaml"
@@ -220,11 +228,14 @@ def test_settings_load_from_file(test_config_file):
 
     # Test that YAML values override defaults
     assert settings.processing.max_workers == 16
+    assert settings.processing.pin_workers is True
     assert settings.database.journal_mode == "DELETE"
 
     # Test get_case_directories
     dirs = settings.get_case_directories()
     assert dirs["scan"] == Path("/mnt/data/input")
+    assert settings.get_case_path("csv_output", "case1") == Path("/mnt/data/csv/case1")
+    assert settings.get_case_path("unknown", "case1") is None
 
     # Test get_database_path
     db_path = settings.get_database_path()
@@ -246,6 +257,11 @@ def test_settings_load_from_file(test_config_file):
     moqui_params = settings.get_moqui_tps_parameters()
     assert moqui_params["SomeSetting"] == "SomeValue"
 
+    # Test file watcher settings
+    assert settings.file_watcher.backend == "polling"
+    assert settings.file_watcher.poll_interval_seconds == 45
+    assert settings.file_watcher.debounce_ms == 250
+
 
 def test_settings_yaml_overrides_env(mock_env_vars, test_config_file):
     """Tests that YAML file settings override environment variables."""
@@ -263,6 +279,11 @@ def test_settings_non_existent_file(capsys):
 
     # Assert that we fall back to defaults/env vars
     assert settings.processing.max_workers == 4  # default
+    assert settings.file_watcher.backend == "auto"
+    assert settings.file_watcher.poll_interval_seconds == 30
+    assert settings.file_watcher.debounce_ms == 500
+    assert settings.processing.case_queue_maxsize == 1024
+    assert settings.processing.pin_workers is False
 
     # Assert that no warning is printed for a non-existent file
     captured = capsys.readouterr()
@@ -288,3 +309,67 @@ def test_settings_invalid_file(invalid_config_file, capsys):
     # Assert that a warning is printed
     captured = capsys.readouterr()
     assert "Warning: Could not load config file" in captured.out
+
+
+def test_settings_getters_are_memoized(test_config_file):
+    """Tests that derived path getters are resolved once and reused."""
+    settings = Settings(config_path=test_config_file)
+
+    assert settings.get_database_path() is settings.get_database_path()
+    case_directories = settings.get_case_directories()
+    assert case_directories["scan"] is settings.get_case_directories()["scan"]
+    assert settings.get_executables() == settings.get_executables()
+    assert settings.case_directories == settings.get_case_directories()
+    assert settings.database_path is settings.get_database_path()
+
+
+def test_settings_getters_are_read_only(test_config_file):
+    """Tests that shared config mappings cannot be mutated by callers."""
+    settings = Settings(config_path=test_config_file)
+
+    with pytest.raises(TypeError):
+        settings.get_case_directories()["scan"] = Path("/elsewhere")
+    with pytest.raises(TypeError):
+        settings.get_hpc_connection()["host"] = "other.cluster"
+
+    params = settings.get_moqui_tps_parameters().copy()
+    params["SomeSetting"] = "Changed"
+    assert settings.get_moqui_tps_parameters()["SomeSetting"] == "SomeValue"
+
+
+def test_settings_reuses_parsed_config_file(test_config_file):
+    """Tests that an unchanged config file is parsed only once."""
+    with patch("src.config.settings.yaml.load", wraps=yaml.load) as mock_load:
+        first = Settings(config_path=test_config_file)
+        second = Settings(config_path=test_config_file)
+
+    assert mock_load.call_count == 1
+    assert second.processing.max_workers == 16
+    # Each Settings keeps its own copy of the parsed document.
+    assert first._yaml_config is not second._yaml_config
+
+
+def test_settings_reparses_modified_config_file(test_config_file):
+    """Tests that a config file is parsed again once its mtime changes."""
+    assert Settings(config_path=test_config_file).processing.max_workers == 16
+
+    config = yaml.safe_load(test_config_file.read_text())
+    config["application"]["max_workers"] = 2
+    test_config_file.write_text(yaml.dump(config))
+    stat = test_config_file.stat()
+    os.utime(test_config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert Settings(config_path=test_config_file).processing.max_workers == 2
+
+
+def test_settings_pickles_after_cached_access(test_config_file):
+    """Tests that Settings can still be sent to worker processes once caches are warm."""
+    settings = Settings(config_path=test_config_file)
+    restored = pickle.loads(pickle.dumps(settings))
+
+    # Paths are resolved at load time and travel with the pickled copy.
+    for name in Settings._RESOLVED_PATHS:
+        assert name in restored.__dict__
+
+    assert restored.database_path == settings.database_path
+    assert restored.case_directories["scan"] == Path("/mnt/data/input")
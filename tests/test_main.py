@@ -0,0 +1,388 @@
+# Tests for main.py
+import os
+import threading
+import time
+from queue import Queue
+from concurrent.futures.process import BrokenProcessPool
+from unittest.mock import MagicMock
+
+import pytest
+import yaml
+from watchdog.events import DirCreatedEvent, FileCreatedEvent
+
+import main
+from main import CaseDetectionHandler
+from src.config.constants import SCAN_MARKER_FILENAME
+from src.domain.enums import BeamStatus, CaseStatus
+from src.domain.models import CaseMessage
+from src.repositories.case_repo import CaseRepository
+
+
+class FakeClock:
+    """A controllable stand-in for time.monotonic."""
+
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Fixture that freezes main's monotonic clock until advanced by the test."""
+    fake = FakeClock()
+    monkeypatch.setattr(main.time, "monotonic", fake)
+    return fake
+
+
+def drain_case_ids(case_queue):
+    """Returns the case ids of every queued batch, in order."""
+    case_ids = []
+    while not case_queue.empty():
+        case_ids.extend(message.case_id for message in case_queue.get_nowait())
+    return case_ids
+
+
+# ===== Tests for CaseDetectionHandler =====
+
+
+def test_handler_ignores_files():
+    """Tests that only directory creation events are queued."""
+    case_queue = Queue()
+    handler = CaseDetectionHandler(case_queue, MagicMock())
+    handler.on_created(FileCreatedEvent("/scan/notes.txt"))
+    assert case_queue.empty()
+
+
+def test_handler_queues_immediately_without_debounce():
+    """Tests that a debounce of 0 queues each case as soon as it is detected."""
+    case_queue = Queue()
+    handler = CaseDetectionHandler(case_queue, MagicMock())
+    handler.on_created(DirCreatedEvent("/scan/case1/"))
+
+    message, = case_queue.get_nowait()
+    assert message.case_id == "case1"
+    assert message.case_path == "/scan/case1/"
+
+
+def test_handler_debounce_uses_each_cases_own_quiet_period(clock):
+    """Tests that a steady stream of new cases does not hold back earlier ones."""
+    case_queue = Queue()
+    handler = CaseDetectionHandler(case_queue, MagicMock(), debounce_ms=500)
+    delays = []
+
+    def record_timer(delay):
+        delays.append(delay)
+        handler._timer = object()
+    handler._start_timer = record_timer
+
+    handler.on_created(DirCreatedEvent("/scan/case1"))
+    clock.now += 0.3
+    handler.on_created(DirCreatedEvent("/scan/case2"))
+    # The second case does not restart the pending timer.
+    assert delays == [0.5]
+
+    clock.now += 0.2
+    handler._flush_pending()
+    assert drain_case_ids(case_queue) == ["case1"]
+    # Rescheduled for case2's own deadline, not a full quiet period.
+    assert delays[-1] == pytest.approx(0.3)
+
+    clock.now += 0.3
+    handler._flush_pending()
+    assert drain_case_ids(case_queue) == ["case2"]
+    assert handler._timer is None
+
+
+def test_handler_debounce_restarts_quiet_period_on_repeat_event(clock):
+    """Tests that an event for a pending case delays its flush."""
+    case_queue = Queue()
+    handler = CaseDetectionHandler(case_queue, MagicMock(), debounce_ms=500)
+    delays = []
+
+    def record_timer(delay):
+        delays.append(delay)
+        handler._timer = object()
+    handler._start_timer = record_timer
+
+    handler.on_created(DirCreatedEvent("/scan/case1"))
+    clock.now += 0.4
+    handler.on_created(DirCreatedEvent("/scan/case1"))
+    clock.now += 0.15
+    handler._flush_pending()
+    assert case_queue.empty()
+    # Rescheduled for the end of the quiet period after the second event.
+    assert delays[-1] == pytest.approx(0.35)
+
+    clock.now += 0.35
+    handler._flush_pending()
+    assert drain_case_ids(case_queue) == ["case1"]
+
+
+def test_handler_debounce_flushes_during_a_continuous_stream():
+    """Tests that cases are released while new cases keep arriving."""
+    case_queue = Queue()
+    handler = CaseDetectionHandler(case_queue, MagicMock(), debounce_ms=50)
+    released_during_stream = False
+    for n in range(15):
+        handler.on_created(DirCreatedEvent(f"/scan/case{n}"))
+        time.sleep(0.03)
+        released_during_stream = released_during_stream or not case_queue.empty()
+    assert released_during_stream
+
+    deadline = time.monotonic() + 2.0
+    case_ids = []
+    while len(case_ids) < 15 and time.monotonic() < deadline:
+        case_ids.extend(drain_case_ids(case_queue))
+        time.sleep(0.01)
+    assert sorted(case_ids) == sorted(f"case{n}" for n in range(15))
+    # Only the timer thread of the pending flush is ever running.
+    assert sum(isinstance(t, threading.Timer) for t in threading.enumerate()) <= 1
+
+
+def test_handler_drops_duplicates_within_ttl(clock):
+    """Tests that repeated events for a case are ignored until the TTL expires."""
+    case_queue = Queue()
+    handler = CaseDetectionHandler(case_queue, MagicMock())
+    for _ in range(3):
+        handler.on_created(DirCreatedEvent("/scan/case1"))
+    assert drain_case_ids(case_queue) == ["case1"]
+
+    clock.now += CaseDetectionHandler.RECENT_TTL_SECONDS + 0.1
+    handler.on_created(DirCreatedEvent("/scan/case1"))
+    assert drain_case_ids(case_queue) == ["case1"]
+
+
+def test_handler_recent_set_is_bounded(clock):
+    """Tests that the recently seen cases are capped, oldest first."""
+    handler = CaseDetectionHandler(Queue(), MagicMock())
+    handler.RECENT_CAPACITY = 3
+    for n in range(5):
+        handler.on_created(DirCreatedEvent(f"/scan/case{n}"))
+    assert list(handler._recent) == ["case2", "case3", "case4"]
+
+
+def test_handler_claim_skips_cases_already_detected(clock):
+    """Tests that the startup scan leaves detected cases to the watcher and vice versa."""
+    case_queue = Queue()
+    handler = CaseDetectionHandler(case_queue, MagicMock())
+    handler.on_created(DirCreatedEvent("/scan/case2"))
+    drain_case_ids(case_queue)
+
+    assert handler.claim(["case1", "case2", "case3"]) == ["case1", "case3"]
+    # A late event for a claimed case is treated as a duplicate.
+    handler.on_created(DirCreatedEvent("/scan/case1"))
+    assert case_queue.empty()
+
+
+# ===== Tests for MQIApplication =====
+
+
+@pytest.fixture
+def app(monkeypatch, tmp_path):
+    """Fixture for an MQIApplication with logging and the beam pool stubbed out.
+    Its config keeps the database and scan directory under tmp_path.
+    """
+    config_content = {
+        "application": {"max_workers": 1},
+        "paths": {
+            "base_directory": str(tmp_path),
+            "local": {
+                "scan_directory": "{base_directory}/scan",
+                "database_path": "{base_directory}/mqi.db"
+            }
+        }
+    }
+    config_path = tmp_path / "config.yaml"
+    with open(config_path, 'w') as f:
+        yaml.dump(config_content, f)
+    application = main.MQIApplication(config_path)
+    application.logger = MagicMock()
+    monkeypatch.setattr(application, "_create_beam_pool", MagicMock())
+    return application
+
+
+def test_worker_loop_stops_draining_when_prep_backlog_is_full(app):
+    """Tests that the case queue is left alone while every prep slot is taken."""
+    app._prep_slots = threading.BoundedSemaphore(2)
+    gate = threading.Event()
+    started = []
+
+    def process_case(case_data):
+        started.append(case_data)
+        gate.wait(timeout=5.0)
+    app._process_case = process_case
+
+    for n in range(5):
+        app.case_queue.put(f"case{n}")
+    loop = threading.Thread(target=app.run_worker_loop)
+    loop.start()
+    try:
+        time.sleep(0.3)
+        assert started == ["case0", "case1"]
+        assert not app.case_queue.empty()
+
+        gate.set()
+        deadline = time.monotonic() + 5.0
+        while len(started) < 5 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert started == [f"case{n}" for n in range(5)]
+    finally:
+        gate.set()
+        app.shutdown_event.set()
+        loop.join(timeout=5.0)
+    assert not loop.is_alive()
+
+
+def test_busy_host_warns_but_keeps_configured_workers(app, monkeypatch):
+    """Tests that a high load average is reported rather than shrinking the pool."""
+    monkeypatch.setattr(main.os, "cpu_count", lambda: 4, raising=False)
+    monkeypatch.setattr(main.os, "getloadavg", lambda: (1.5, 1.0, 1.0), raising=False)
+    app.settings.processing.max_workers = 3
+    app.shutdown_event.set()
+    app.run_worker_loop()
+    assert app._beam_pool_size == 3
+    app.logger.warning.assert_called_once()
+
+    app.logger.reset_mock()
+    app._warn_if_host_busy(2)
+    app.logger.warning.assert_not_called()
+
+
+def test_submit_beam_replaces_a_broken_pool_once(app):
+    """Tests that a broken pool is swapped for a new one and the beam resubmitted."""
+    broken_pool = MagicMock()
+    broken_pool.submit.side_effect = BrokenProcessPool("worker died")
+    new_pool = MagicMock()
+    app.executor = broken_pool
+    app._create_beam_pool.return_value = new_pool
+
+    future = app._submit_beam("beam1", "/scan/case1/beam1")
+
+    app._create_beam_pool.assert_called_once_with()
+    broken_pool.shutdown.assert_called_once_with(wait=False)
+    new_pool.submit.assert_called_once_with(main.worker_main, beam_id="beam1",
+                                            beam_path="/scan/case1/beam1")
+    assert future is new_pool.submit.return_value
+    assert app.executor is new_pool
+
+
+def test_drain_case_queue_flattens_lists_up_to_max_items(app):
+    """Tests that queued lists are unpacked and extra items stay queued."""
+    app.case_queue.put(["case1", "case2", "case3"])
+    app.case_queue.put("case4")
+    app.case_queue.put("case5")
+
+    assert app._drain_case_queue(max_items=2) == ["case1", "case2", "case3", "case4"]
+    assert app._drain_case_queue(max_items=2) == ["case5"]
+
+
+def test_drain_case_queue_returns_empty_after_poll_timeout(app, monkeypatch):
+    """Tests that an empty queue is waited on only for the poll interval."""
+    monkeypatch.setattr(app, "QUEUE_POLL_SECONDS", 0.01)
+    assert app._drain_case_queue(max_items=2) == []
+
+
+@pytest.fixture
+def case_repo(app):
+    """Fixture that initializes the application's database in tmp_path."""
+    app.initialize_database()
+    yield CaseRepository(app.db_connection, app.logger)
+    app.db_connection.close()
+
+
+def test_resumed_case_dispatches_only_unfinished_beams(app, case_repo, tmp_path,
+                                                       monkeypatch):
+    """Tests that resuming a case keeps finished beams and reruns the others."""
+    beam_jobs = [{"beam_id": f"case1_beam{n}", "beam_path": tmp_path / f"beam{n}"}
+                 for n in range(3)]
+    case_repo.create_case_with_beams("case1", str(tmp_path), beam_jobs)
+    case_repo.update_beam_status("case1_beam0", BeamStatus.COMPLETED)
+    case_repo.update_beam_status("case1_beam1", BeamStatus.HPC_RUNNING)
+
+    monkeypatch.setattr(main, "prepare_beam_jobs", lambda *args: beam_jobs)
+    monkeypatch.setattr(main, "run_case_level_csv_interpreting", lambda *args: True)
+    tps_generation = MagicMock(return_value=[{"gpu_id": 0}])
+    monkeypatch.setattr(main, "run_case_level_tps_generation", tps_generation)
+    monkeypatch.setattr(main, "run_case_level_upload", lambda *args: True)
+    app._beam_slots = threading.BoundedSemaphore(4)
+    app._submit_beam = MagicMock()
+
+    app._process_case(CaseMessage("case1", str(tmp_path), 0))
+
+    submitted = [call.args[0] for call in app._submit_beam.call_args_list]
+    assert submitted == ["case1_beam1", "case1_beam2"]
+    # The TPS file still covers every beam of the case.
+    assert tps_generation.call_args.args[2] == 3
+    statuses = [beam.status for beam in case_repo.get_beams_for_case("case1")]
+    assert statuses == [BeamStatus.COMPLETED, BeamStatus.PENDING, BeamStatus.PENDING]
+
+
+# ===== Tests for the startup scan marker =====
+
+
+@pytest.fixture
+def scan_dir(app, case_repo):
+    """Fixture for the configured scan directory holding completed case1 and case2."""
+    scan_directory = app.settings.case_directories["scan"]
+    for case_id in ("case1", "case2"):
+        (scan_directory / case_id).mkdir(parents=True)
+        case_repo.add_case(case_id, scan_directory / case_id)
+        case_repo.update_case_status(case_id, CaseStatus.COMPLETED)
+    return scan_directory
+
+
+def run_startup_scan(app):
+    """Runs the startup scan and returns the case ids it queued."""
+    main.scan_existing_cases(app.case_queue, app.settings, app.logger, app.db_connection)
+    return drain_case_ids(app.case_queue)
+
+
+def skipped_directory_scan(app):
+    """Returns whether the last startup scan trusted the marker."""
+    return any("unchanged" in call.args[0] for call in app.logger.info.call_args_list)
+
+
+def test_scan_marker_written_only_when_every_case_is_recorded(app, scan_dir, tmp_path):
+    """Tests that an unrecorded case directory keeps the marker from being written."""
+    (scan_dir / "case3").mkdir()
+    main.record_scan_marker(app.settings, app.logger, app.db_connection)
+    assert not (tmp_path / SCAN_MARKER_FILENAME).exists()
+
+    CaseRepository(app.db_connection, app.logger).add_case("case3", scan_dir / "case3")
+    main.record_scan_marker(app.settings, app.logger, app.db_connection)
+    marker = (tmp_path / SCAN_MARKER_FILENAME).read_text()
+    assert int(marker) == os.stat(scan_dir).st_mtime_ns
+
+
+def test_scan_marker_is_consumed_once(app, scan_dir, tmp_path):
+    """Tests that the marker is removed by the scan that reads it."""
+    main.record_scan_marker(app.settings, app.logger, app.db_connection)
+    assert run_startup_scan(app) == []
+    assert skipped_directory_scan(app)
+    assert not (tmp_path / SCAN_MARKER_FILENAME).exists()
+
+    app.logger.reset_mock()
+    run_startup_scan(app)
+    assert not skipped_directory_scan(app)
+
+
+def test_scan_marker_with_changed_mtime_forces_full_scan(app, scan_dir):
+    """Tests that a case directory added after the marker was written is queued."""
+    # Backdate the directory so adding a case is sure to change its mtime.
+    os.utime(scan_dir, ns=(10**18, 10**18))
+    main.record_scan_marker(app.settings, app.logger, app.db_connection)
+    (scan_dir / "case3").mkdir()
+
+    assert run_startup_scan(app) == ["case3"]
+    assert not skipped_directory_scan(app)
+
+
+def test_scan_marker_skip_still_requeues_active_cases(app, case_repo, scan_dir):
+    """Tests that unfinished cases are resumed even when the directory scan is skipped."""
+    case_repo.update_case_status("case1", CaseStatus.PROCESSING)
+    main.record_scan_marker(app.settings, app.logger, app.db_connection)
+
+    assert run_startup_scan(app) == ["case1"]
+    assert skipped_directory_scan(app)
@@ -2,7 +2,7 @@ import pytest
 from pathlib import Path
 import os
 import shutil
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, mock_open, patch
 
 from src.utils.path_manager import PathManager
 from src.domain.errors import ValidationError
@@ -155,3 +155,17 @@ class TestPathManager:
             "Path operation",
             {"operation": "ensure_directory", "path": str(new_dir), "success": True}
         )
+
+    @pytest.mark.skipif(os.name == "nt", reason="Uses the Linux mount table")
+    def test_is_network_filesystem(self, path_manager):
+        """Test that the filesystem type of the longest matching mount is used."""
+        mounts = (
+            "/dev/sda1 / ext4 rw 0 0\n"
+            "server:/export /mnt/cases nfs4 rw 0 0\n"
+            "//host/share /mnt/cases/local ext4 rw 0 0\n"
+        )
+        with patch("builtins.open", mock_open(read_data=mounts)), \
+                patch("os.path.realpath", side_effect=lambda p: p):
+            assert path_manager.is_network_filesystem("/mnt/cases/case1")
+            assert not path_manager.is_network_filesystem("/mnt/cases/local/case1")
+            assert not path_manager.is_network_filesystem("/mnt/casesX")